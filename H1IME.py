@@ -5,6 +5,7 @@ import json
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import win32com.client
 import time
 from rtlsdr import RtlSdr
@@ -13,6 +14,31 @@ from datetime import datetime
 import traceback
 import asyncio
 import math
+import sqlite3
+import glob
+import hashlib
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from multiprocessing import shared_memory
+from collections import deque
+import tempfile
+import shutil
+import io
+
+# Optional FFT libraries; NumPy is used when neither is installed
+try:
+    import pyfftw
+except ImportError:
+    pyfftw = None
+try:
+    import scipy.fft as scipy_fft
+except ImportError:
+    scipy_fft = None
+try:
+    import scipy.ndimage as scipy_ndimage
+except ImportError:
+    scipy_ndimage = None
 
 # Global variables for Data Collection
 output_folder = ""
@@ -27,6 +53,43 @@ sdr_bandwidth = 10000  # Hz (new variable for frequency range)
 settle_time = 2  # seconds
 telescope_progid = "EQMOD.Telescope"
 
+# Scan catalog settings
+CATALOG_FILENAME = "scan_catalog.sqlite"
+CACHE_FOLDER_NAME = ".h1ime_cache"
+
+# Raw IQ recording settings
+record_raw_iq = False
+spectrum_channels = 0  # Channels of the per-point spectrum saved with each reading; 0 saves none
+RAW_INDEX_FILENAME = "raw_index.json"
+SAMPLES_PER_MEASUREMENT = 256000
+WINDOW_FUNCTIONS = ["none", "hann", "hamming", "blackman"]
+
+# Out-of-process capture settings
+capture_out_of_process = False
+CAPTURE_RING_SECONDS = 8  # Seconds of samples the shared ring buffer holds
+CAPTURE_CHUNK_BYTES = 262144  # Bytes per async USB transfer (must be a multiple of 512)
+CAPTURE_HEADER_BYTES = 64
+CAPTURE_WRITE, CAPTURE_STATUS, CAPTURE_STOP = 0, 1, 2  # Header fields (int64)
+CAPTURE_STARTING, CAPTURE_RUNNING, CAPTURE_STOPPED, CAPTURE_FAILED = 0, 1, 2, -1
+
+# FFT backend settings
+fft_backend = None  # Selected on first use; see select_fft_backend
+FFT_BACKENDS = ["auto", "pyfftw", "scipy", "numpy"]
+fft_threads = os.cpu_count() or 1  # Threads per pyFFTW plan; 1 in reprocessing worker processes
+FFT_WISDOM_PATH = os.path.join(os.path.expanduser("~"), "h1ime_fftw_wisdom.dat")
+
+# Physical constants
+SPEED_OF_LIGHT = 299792458.0  # m/s
+HI_REST_FREQUENCY = 1420405751.768  # Hz
+HI_WAVELENGTH = SPEED_OF_LIGHT / HI_REST_FREQUENCY  # m
+EARTH_ORBITAL_SPEED = 29.789  # km/s, sqrt(GM / (a * (1 - e^2))) for Earth's orbit
+EARTH_ORBIT_ECCENTRICITY = 0.016709
+EARTH_PERIHELION_LONGITUDE = 102.937  # deg, ecliptic longitude of Earth's perihelion
+OBLIQUITY = 23.4393  # deg, J2000
+SOLAR_MOTION_SPEED = 20.0  # km/s, standard solar motion used to define the LSR
+SOLAR_APEX_RA, SOLAR_APEX_DEC = 270.9595, 30.0047  # deg, J2000 direction of the standard solar motion
+VELOCITY_FRAMES = ["lsr", "barycentric", "topocentric"]
+
 # List of common ASCOM telescope drivers
 TELESCOPE_DRIVERS = [
     "EQMOD.Telescope",
@@ -38,7 +101,24 @@ TELESCOPE_DRIVERS = [
 ]
 
 # Modes for the combobox
-MODES = ["Data Collection", "Image Assembly", "Slew Tool", "Calculators"]
+MODES = ["Data Collection", "Time Series", "Image Assembly", "Slew Tool", "Calculators"]
+
+# Scan modes for Data Collection
+SCAN_MODES = ["Uniform Spiral", "Adaptive (coarse-to-fine)"]
+
+# Time series settings
+TIME_SERIES_MODES = ["Hold Pointing (tracking)", "Drift Scan (tracking off)"]
+TIME_SERIES_LEVELS = (1, 10, 60)  # Decimation levels, in integrations per output row
+TIME_SERIES_CHUNK_ROWS = 600
+STRIP_CHART_POINTS = 1800
+SIDEREAL_RATE = 15.041067  # deg of RA per hour that the sky drifts past a parked beam
+
+# Scan quality control settings
+QC_HISTOGRAM_BIN_DB = 0.25
+QC_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+QC_OUTLIER_SIGMA = 5.0  # Robust sigmas from the median before a point is flagged as an outlier
+QC_RFI_SIGMA = 8.0  # Robust sigmas a spectral channel must stand above its neighbours to count as RFI
+QC_MIN_POINTS = 10  # Points measured before outliers are flagged
 
 # Utility class for redirecting stdout to GUI
 class StdoutRedirector:
@@ -53,6 +133,306 @@ class StdoutRedirector:
     def flush(self):
         pass
 
+# Utility class for timing the phases of a scan
+class ScanTimer:
+    PHASES = ("connect", "slew", "settle", "capture", "fft", "plot", "save")
+    SCAN_PHASES = ("connect", "save")  # Happen once per scan, not per point
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.scan_start = clock()
+        self.totals = dict.fromkeys(self.PHASES, 0.0)
+        self.point_durations = {}
+        self.points_completed = 0
+        self._started = {}
+
+    def start(self, phase):
+        self._started[phase] = self.clock()
+
+    def stop(self, phase):
+        started = self._started.pop(phase, None)
+        if started is None:
+            return 0.0
+        duration = self.clock() - started
+        self.totals[phase] = self.totals.get(phase, 0.0) + duration
+        if phase not in self.SCAN_PHASES:
+            self.point_durations[phase] = self.point_durations.get(phase, 0.0) + duration
+        return duration
+
+    @contextlib.contextmanager
+    def phase(self, phase):
+        self.start(phase)
+        try:
+            yield
+        finally:
+            self.stop(phase)
+
+    def end_point(self):
+        # Return the durations recorded since the previous point and start a new one
+        durations = {phase: round(duration, 4) for phase, duration in self.point_durations.items()}
+        self.point_durations = {}
+        self.points_completed += 1
+        return durations
+
+    def elapsed(self):
+        return self.clock() - self.scan_start
+
+    def efficiency(self):
+        # Fraction of wall-clock time spent integrating signal
+        elapsed = self.elapsed()
+        return self.totals["capture"] / elapsed if elapsed > 0 else 0.0
+
+    def summary(self):
+        elapsed = self.elapsed()
+        points = max(1, self.points_completed)
+        return {
+            'elapsed': round(elapsed, 3),
+            'points': self.points_completed,
+            'efficiency': round(self.efficiency(), 4),
+            'totals': {phase: round(total, 3) for phase, total in self.totals.items()},
+            'per_point': {phase: round(total / points, 4) for phase, total in self.totals.items()},
+            'untracked': round(max(0.0, elapsed - sum(self.totals.values())), 3)
+        }
+
+# Utility classes for streaming scan statistics
+class P2Quantile:
+    """
+    Running estimate of one quantile in constant memory (the P-squared algorithm of Jain and
+    Chlamtac): five markers track the minimum, the quantile, the maximum and two points between.
+    """
+    def __init__(self, p):
+        self.p = p
+        self.count = 0
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x):
+        self.count += 1
+        if self.count <= 5:
+            self.heights.append(x)
+            self.heights.sort()
+            return
+        h, n = self.heights, self.positions
+        if x < h[0]:
+            h[0] = x
+            k = 0
+        elif x >= h[4]:
+            h[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if h[i] <= x < h[i + 1])
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                # Parabolic prediction, falling back to linear if it would break the marker order
+                q = h[i] + d / (n[i + 1] - n[i - 1]) * ((n[i] - n[i - 1] + d) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+                                                        + (n[i + 1] - n[i] - d) * (h[i] - h[i - 1]) / (n[i] - n[i - 1]))
+                if not h[i - 1] < q < h[i + 1]:
+                    q = h[i] + d * (h[i + d] - h[i]) / (n[i + d] - n[i])
+                h[i] = q
+                n[i] += d
+
+    def value(self):
+        if self.count == 0:
+            return float('nan')
+        if self.count <= 5:
+            return float(np.percentile(self.heights, self.p * 100))
+        return self.heights[2]
+
+class ScanQualityMonitor:
+    """
+    Quality statistics for a scan, updated as each point arrives without keeping the data:
+    a histogram of intensities, quantile estimates, mean and spread, a noise estimate from
+    the differences between consecutive points, outlier/RFI flags and drift versus time.
+
+    Flagged points are kept out of the statistics and listed in 'flagged' instead, so a
+    re-measure replaces the bad sample rather than adding to it: every reading is counted
+    once, either in 'points' or in 'excluded' (unresolved flags).
+
+    Drift is fitted to the spectral baseline (median channel) when spectra are saved, since
+    that follows receiver gain rather than sky structure; otherwise to the intensity itself.
+    """
+    def __init__(self, bin_width=QC_HISTOGRAM_BIN_DB, quantiles=QC_QUANTILES, outlier_sigma=QC_OUTLIER_SIGMA,
+                 rfi_sigma=QC_RFI_SIGMA, min_points=QC_MIN_POINTS):
+        self.bin_width = bin_width
+        self.outlier_sigma = outlier_sigma
+        self.rfi_sigma = rfi_sigma
+        self.min_points = min_points
+        self.histogram = {}
+        self.quantiles = {q: P2Quantile(q) for q in sorted(set(quantiles) | {0.25, 0.5, 0.75})}
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = float('inf')
+        self.maximum = float('-inf')
+        self.previous = None
+        self.diff_count = 0
+        self.diff_sumsq = 0.0
+        self.start_time = None
+        self.drift_sums = np.zeros(5)  # n, t, y, t*t, t*y
+        self.drift_hours = 0.0
+        self.drift_source = 'intensity'
+        self.flagged = []
+        self.queued = 0
+        self.remeasured = 0
+
+    def robust_sigma(self):
+        # Interquartile range scaled to a Gaussian sigma; barely moved by a few bad points
+        return (self.quantiles[0.75].value() - self.quantiles[0.25].value()) / 1.349
+
+    def check_spectrum(self, spectrum):
+        # RFI is narrow: compare each channel with the median of its neighbours so the broad HI line is ignored
+        spectrum = np.asarray(spectrum, dtype=float)
+        if spectrum.size < 5:
+            return False
+        windows = np.lib.stride_tricks.sliding_window_view(np.pad(spectrum, 2, mode='edge'), 5)
+        neighbours = np.median(windows[:, [0, 1, 3, 4]], axis=1)
+        residual = spectrum - neighbours
+        sigma = 1.4826 * np.median(np.abs(residual - np.median(residual)))
+        return bool(sigma > 0 and residual.max() > self.rfi_sigma * sigma)
+
+    def add(self, index, ra, dec, intensity, timestamp, spectrum=None):
+        """Add one point (timestamp in seconds) and return the list of flags raised for it."""
+        flags = []
+        if self.count >= self.min_points:
+            sigma = self.robust_sigma()
+            if sigma > 0 and abs(intensity - self.quantiles[0.5].value()) > self.outlier_sigma * sigma:
+                flags.append('outlier')
+        if spectrum is not None and self.check_spectrum(spectrum):
+            flags.append('rfi')
+        if flags:
+            self.flagged.append({'index': index, 'RA': ra, 'DEC': dec, 'INTENSITY': intensity, 'FLAGS': flags})
+            return flags
+
+        bin_index = int(np.floor(intensity / self.bin_width))
+        self.histogram[bin_index] = self.histogram.get(bin_index, 0) + 1
+        for estimator in self.quantiles.values():
+            estimator.add(intensity)
+        # Welford's update for the mean and variance
+        self.count += 1
+        delta = intensity - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (intensity - self.mean)
+        self.minimum = min(self.minimum, intensity)
+        self.maximum = max(self.maximum, intensity)
+        if self.previous is not None:
+            self.diff_count += 1
+            self.diff_sumsq += (intensity - self.previous) ** 2
+        self.previous = intensity
+
+        if self.start_time is None:
+            self.start_time = timestamp
+        if spectrum is not None:
+            self.drift_source = 'baseline'
+            value = linear_to_dB(np.median(spectrum) + 1e-10)
+        else:
+            value = intensity
+        hours = (timestamp - self.start_time) / 3600
+        self.drift_sums += (1, hours, value, hours * hours, hours * value)
+        self.drift_hours = hours
+        return flags
+
+    def resolve(self, index):
+        # The reading at index is being re-measured; its flagged sample no longer counts
+        for entry in self.flagged:
+            if entry['index'] == index and not entry.get('RESOLVED'):
+                entry['RESOLVED'] = True
+        self.remeasured += 1
+
+    def drift(self):
+        # Least-squares slope of the drift value against time, in dB per hour
+        n, t, y, tt, ty = self.drift_sums
+        denominator = n * tt - t * t
+        if n < 3 or denominator <= 0 or self.drift_hours < 1 / 60:
+            return None  # Too little time covered for a meaningful slope
+        return (n * ty - t * y) / denominator
+
+    def take_flagged(self):
+        # Flagged points not yet handed out for re-measuring
+        pending = [entry for entry in self.flagged[self.queued:] if not entry.get('RESOLVED')]
+        self.queued = len(self.flagged)
+        return pending
+
+    def summary(self):
+        std = float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else None
+        noise = float(np.sqrt(self.diff_sumsq / self.diff_count / 2)) if self.diff_count else None
+        drift = self.drift()
+        return {
+            'points': self.count,
+            'mean': round(self.mean, 4) if self.count else None,
+            'std': round(std, 4) if std is not None else None,
+            'min': round(self.minimum, 4) if self.count else None,
+            'max': round(self.maximum, 4) if self.count else None,
+            'quantiles': {f"{q:g}": round(estimator.value(), 4) for q, estimator in self.quantiles.items()},
+            'robust_sigma': round(self.robust_sigma(), 4) if self.count else None,
+            'noise': round(noise, 4) if noise is not None else None,
+            'drift_db_per_hour': round(drift, 4) if drift is not None else None,
+            'drift_source': self.drift_source,
+            'histogram_bin_width': self.bin_width,
+            'histogram': {f"{bin_index * self.bin_width:.2f}": count for bin_index, count in sorted(self.histogram.items())},
+            'flagged': self.flagged,
+            'excluded': sum(1 for entry in self.flagged if not entry.get('RESOLVED')),
+            'remeasured': self.remeasured
+        }
+
+# Utility class for writing raw 8-bit IQ samples to per-point memory-mapped files
+class RawIQRecorder:
+    def __init__(self, folder, header):
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+        self.index = {'format': 'uint8 interleaved I/Q', 'scan': header, 'points': []}
+        self.entry = None
+        self.replace = None
+        self.files_written = 0
+        self.memmap = None
+        self.offset = 0
+
+    def begin_point(self, ra, dec, replace=None):
+        # replace: index of an earlier point this one re-measures; its entry and file are superseded
+        self.files_written += 1
+        file_name = f"point_{self.files_written:05d}.iq"
+        self.entry = {'file': file_name, 'RA': ra, 'DEC': dec,
+                      'START_TIME': datetime.now().strftime("%Y-%m-%d_%H-%M-%S.%f")}
+        self.replace = replace
+        self.memmap = None
+        self.offset = 0
+
+    def allocate(self, num_bytes):
+        self.memmap = np.memmap(os.path.join(self.folder, self.entry['file']), dtype=np.uint8, mode='w+', shape=(num_bytes,))
+        self.offset = 0
+
+    def write(self, raw):
+        self.memmap[self.offset:self.offset + raw.size] = raw
+        self.offset += raw.size
+
+    def end_point(self, intensity=None):
+        if self.memmap is not None:
+            self.memmap.flush()
+            self.memmap = None
+        self.entry['END_TIME'] = datetime.now().strftime("%Y-%m-%d_%H-%M-%S.%f")
+        self.entry['NUM_BYTES'] = self.offset
+        self.entry['INTENSITY'] = intensity
+        if self.replace is None:
+            self.index['points'].append(self.entry)
+        else:
+            old_file = os.path.join(self.folder, self.index['points'][self.replace]['file'])
+            self.entry['REMEASURED'] = True
+            self.index['points'][self.replace] = self.entry
+            if os.path.exists(old_file):
+                os.remove(old_file)
+        self.entry = None
+        self.replace = None
+        # Rewrite the index after every point so an interrupted scan can still be reprocessed
+        with open(os.path.join(self.folder, RAW_INDEX_FILENAME), 'w') as file:
+            json.dump(self.index, file)
+
 # Logging function
 def log_error(error_message):
     try:
@@ -140,6 +520,87 @@ def iterative_spiral(center_ra: float, center_dec: float, width: int, height: in
         y_max -= 1
     return points
 
+def order_points_for_slew(points, start):
+    """
+    Order points into a short slew path by always moving to the nearest remaining point.
+    Distance is the larger of the RA and Dec offsets, since both mount axes move at once.
+    """
+    remaining = list(points)
+    ordered = []
+    current = start
+    while remaining:
+        index = min(range(len(remaining)), key=lambda k: max(abs(remaining[k][0] - current[0]), abs(remaining[k][1] - current[1])))
+        current = remaining.pop(index)
+        ordered.append(current)
+    return ordered
+
+class AdaptiveRefiner:
+    """
+    Coarse-to-fine point planner for adaptive mapping.
+
+    The fine lattice is the uniform grid the scan would otherwise cover. Measurement starts on
+    every coarse_step-th lattice cell (plus the last row and column, so the map extent is known
+    from the start). After each batch, any measured cell that differs from a measured neighbour
+    at the current step by more than threshold dB gets the unmeasured cells around it at half the
+    step. This repeats until the step reaches one lattice cell, the beam-limited spacing.
+    """
+    def __init__(self, lattice_points, spacing, coarse_step, threshold):
+        self.spacing = spacing
+        self.threshold = threshold
+        self.ra_min = min(ra for ra, _ in lattice_points)
+        self.dec_min = min(dec for _, dec in lattice_points)
+        self.lattice = {self.cell(ra, dec): (ra, dec) for ra, dec in lattice_points}
+        self.width = max(ix for ix, _ in self.lattice) + 1
+        self.height = max(iy for _, iy in self.lattice) + 1
+        self.step = max(1, int(coarse_step))
+        self.measured = {}
+        self.consumed = 0
+        self.last_batch = []
+
+    def cell(self, ra, dec):
+        return int(round((ra - self.ra_min) / self.spacing)), int(round((dec - self.dec_min) / self.spacing))
+
+    def initial_points(self, start):
+        xs = sorted(set(range(0, self.width, self.step)) | {self.width - 1})
+        ys = sorted(set(range(0, self.height, self.step)) | {self.height - 1})
+        self.last_batch = [(ix, iy) for iy in ys for ix in xs]
+        return order_points_for_slew([self.lattice[c] for c in self.last_batch], start)
+
+    def replace(self, reading):
+        # A re-measured reading supersedes the value already taken into account
+        self.measured[self.cell(reading['RA'], reading['DEC'])] = reading['INTENSITY']
+
+    def __call__(self, readings):
+        """Take the scan's readings so far and return the next batch of points (empty when done)."""
+        for reading in readings[self.consumed:]:
+            self.measured[self.cell(reading['RA'], reading['DEC'])] = reading['INTENSITY']
+        self.consumed = len(readings)
+        while self.step > 1:
+            half = self.step // 2
+            candidates = set()
+            for ix, iy in self.last_batch:
+                value = self.measured.get((ix, iy))
+                if value is None:
+                    continue
+                neighbours = [self.measured.get((ix + dx, iy + dy)) for dx, dy in
+                              ((self.step, 0), (-self.step, 0), (0, self.step), (0, -self.step))]
+                contrast = max((abs(value - n) for n in neighbours if n is not None), default=0.0)
+                if contrast > self.threshold:
+                    for dx in (-half, 0, half):
+                        for dy in (-half, 0, half):
+                            c = (ix + dx, iy + dy)
+                            if c in self.lattice and c not in self.measured:
+                                candidates.add(c)
+            self.step = half
+            if candidates:
+                self.last_batch = sorted(candidates)
+                print(f"Adaptive refinement: {len(candidates)} new points at {self.step * self.spacing:.3f} degree spacing")
+                last_ra, last_dec = readings[-1]['RA'], readings[-1]['DEC']
+                return order_points_for_slew([self.lattice[c] for c in self.last_batch], (last_ra, last_dec))
+            # Nothing to refine at this step; the measured cells are also the next level's neighbours
+            self.last_batch = list(self.measured)
+        return []
+
 def setup_sdr(sample_rate, center_frequency, gain):
     try:
         sdr = RtlSdr()
@@ -154,7 +615,327 @@ def setup_sdr(sample_rate, center_frequency, gain):
         log_error(error_msg)
         raise
 
-def measure_point(sdr, readings_per_measurement, num_samples=256000, freq_range=10000):
+def bytes_to_iq(raw):
+    # Same scaling as RtlSdr.read_samples: unsigned 8-bit I/Q pairs to complex values in [-1, 1]
+    iq = raw.astype(np.float64).view(np.complex128)
+    iq /= 127.5
+    iq -= (1 + 1j)
+    return iq
+
+_window_cache = {}
+
+def get_window(name, size):
+    if name is None or name == "none":
+        return None
+    key = (name, size)
+    if key not in _window_cache:
+        functions = {"hann": np.hanning, "hamming": np.hamming, "blackman": np.blackman}
+        if name not in functions:
+            raise ValueError(f"Unknown window function: {name}")
+        window = functions[name](size)
+        # Normalize so windowed and unwindowed powers are on the same scale
+        _window_cache[key] = window / np.sqrt(np.mean(window ** 2))
+    return _window_cache[key]
+
+# FFT backend functions
+_fft_plans = {}
+
+def load_fft_wisdom():
+    if pyfftw is None or not os.path.exists(FFT_WISDOM_PATH):
+        return
+    try:
+        # Wisdom is plain text per precision, stored separated by NUL bytes
+        with open(FFT_WISDOM_PATH, 'rb') as file:
+            pyfftw.import_wisdom(tuple(file.read().split(b"\0")))
+    except Exception as e:
+        print(f"Ignoring unreadable FFTW wisdom {FFT_WISDOM_PATH}: {str(e)}")
+
+def save_fft_wisdom():
+    # Persist FFTW plans so the next run does not have to measure them again
+    if fft_backend != "pyfftw":
+        return
+    try:
+        with open(FFT_WISDOM_PATH, 'wb') as file:
+            file.write(b"\0".join(pyfftw.export_wisdom()))
+    except Exception as e:
+        error_msg = f"Error saving FFTW wisdom: {str(e)}"
+        print(error_msg)
+        log_error(error_msg)
+
+def select_fft_backend(preferred="auto"):
+    """
+    Choose the FFT implementation used by compute_power_spectrum.
+
+    "auto" picks pyFFTW, then scipy.fft, then NumPy, depending on what is installed. Asking for a
+    backend that is not installed falls back the same way. Returns the name of the active backend.
+    """
+    global fft_backend
+    available = {"pyfftw": pyfftw is not None, "scipy": scipy_fft is not None, "numpy": True}
+    if preferred in available and available[preferred]:
+        backend = preferred
+    else:
+        if preferred != "auto":
+            print(f"FFT backend '{preferred}' is not installed, choosing automatically")
+        backend = next(name for name in ("pyfftw", "scipy", "numpy") if available[name])
+    if backend != fft_backend:
+        _fft_plans.clear()
+        if backend == "pyfftw":
+            load_fft_wisdom()
+        fft_backend = backend
+    print(f"FFT backend: {describe_fft_backend()}")
+    return fft_backend
+
+def describe_fft_backend():
+    if fft_backend == "pyfftw":
+        return f"pyFFTW ({fft_threads} threads, {len(_fft_plans)} cached plans)"
+    if fft_backend == "scipy":
+        # scipy's workers only split batches of transforms, and each read is a single 1-D FFT
+        return "scipy.fft (single-threaded)"
+    return "NumPy (single-threaded)"
+
+def fft(samples):
+    # Forward FFT along the last axis with the selected backend
+    if fft_backend is None:
+        select_fft_backend()
+    if fft_backend == "pyfftw":
+        key = (samples.shape, samples.dtype.str, fft_threads)
+        plan = _fft_plans.get(key)
+        if plan is None:
+            plan = pyfftw.builders.fft(pyfftw.empty_aligned(samples.shape, dtype=samples.dtype),
+                                       threads=fft_threads, planner_effort='FFTW_MEASURE')
+            _fft_plans[key] = plan
+        # The plan reuses its output buffer: the result is only valid until the next FFT of this size
+        return plan(samples)
+    if fft_backend == "scipy":
+        return scipy_fft.fft(samples)
+    return np.fft.fft(samples)
+
+def prepare_fft(num_samples=SAMPLES_PER_MEASUREMENT):
+    # Build (and persist) the plan for the scan's FFT size before the first point is measured
+    fft(np.zeros(num_samples, dtype=np.complex128))
+    save_fft_wisdom()
+
+def compute_power_spectrum(samples, sample_rate, center_freq, window=None):
+    window_values = get_window(window, len(samples))
+    if window_values is not None:
+        samples = samples * window_values
+    fft_result = np.fft.fftshift(fft(samples))
+    freqs = np.fft.fftshift(np.fft.fftfreq(len(samples), 1 / sample_rate)) + center_freq
+    power_spectrum = np.abs(fft_result) ** 2
+    return freqs, power_spectrum
+
+def apply_rfi_filter(power_spectrum, threshold):
+    # Replace channels more than threshold robust sigmas above the median with the median
+    if not threshold:
+        return power_spectrum
+    median = np.median(power_spectrum)
+    sigma = 1.4826 * np.median(np.abs(power_spectrum - median))
+    return np.where(power_spectrum > median + threshold * sigma, median, power_spectrum)
+
+def integrate_band(freqs, power_spectrum, center_freq, freq_range):
+    # Select frequency range around center frequency
+    freq_mask = (center_freq - freq_range <= freqs) & (freqs <= center_freq + freq_range)
+    if not np.any(freq_mask):
+        raise ValueError("No frequencies in the specified range")
+    # Sum power in the selected frequency range (in linear units)
+    return np.sum(power_spectrum[freq_mask])
+
+def bin_spectrum(freqs, power_spectrum, channels):
+    # Average neighbouring FFT bins down to a fixed number of channels
+    usable = len(power_spectrum) - len(power_spectrum) % channels
+    return freqs[:usable].reshape(channels, -1).mean(axis=1), power_spectrum[:usable].reshape(channels, -1).mean(axis=1)
+
+def capture_process_main(shm_name, capacity, sample_rate, center_frequency, gain, chunk_bytes):
+    """
+    Entry point of the capture process: stream the dongle into the shared ring with the async
+    read callback until the consumer sets the stop flag. Must stay at module level so it can be
+    started with the spawn method used on Windows.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    header = np.ndarray((CAPTURE_HEADER_BYTES // 8,), dtype=np.int64, buffer=shm.buf)
+    ring = np.ndarray((capacity,), dtype=np.uint8, buffer=shm.buf, offset=CAPTURE_HEADER_BYTES)
+    try:
+        sdr = setup_sdr(sample_rate, center_frequency, gain)
+        header[CAPTURE_STATUS] = CAPTURE_RUNNING
+
+        def on_samples(values, context):
+            if header[CAPTURE_STOP]:
+                sdr.cancel_read_async()
+                return
+            data = np.frombuffer(values, dtype=np.uint8)
+            position = int(header[CAPTURE_WRITE] % capacity)
+            first = min(data.size, capacity - position)
+            ring[position:position + first] = data[:first]
+            ring[:data.size - first] = data[first:]
+            # Publish the new bytes only after they are in the ring
+            header[CAPTURE_WRITE] += data.size
+
+        sdr.read_bytes_async(on_samples, chunk_bytes)
+        sdr.close()
+        header[CAPTURE_STATUS] = CAPTURE_STOPPED
+    except Exception as e:
+        header[CAPTURE_STATUS] = CAPTURE_FAILED
+        log_error(f"Error in capture process: {str(e)}\n{traceback.format_exc()}")
+    finally:
+        del header, ring
+        shm.close()
+
+class SharedMemoryCapture:
+    """
+    Drop-in replacement for the RtlSdr object used by measure_point, backed by a capture process.
+
+    The capture process writes raw bytes into a preallocated shared-memory ring. read_bytes returns
+    a zero-copy view of the ring (copying only when a read wraps around its end) and read_samples
+    converts into a reused complex buffer, so steady-state reads allocate nothing. Reads that fall
+    more than a ring's length behind the writer are counted as overflows and skip ahead.
+    """
+    def __init__(self, sample_rate, center_freq, gain, ring_seconds=CAPTURE_RING_SECONDS, chunk_bytes=CAPTURE_CHUNK_BYTES):
+        self.sample_rate = sample_rate
+        self.center_freq = center_freq
+        self.chunk_bytes = chunk_bytes
+        chunks = max(4, math.ceil(ring_seconds * sample_rate * 2 / chunk_bytes))
+        self.capacity = chunks * chunk_bytes
+        self.shm = shared_memory.SharedMemory(create=True, size=CAPTURE_HEADER_BYTES + self.capacity)
+        self.header = np.ndarray((CAPTURE_HEADER_BYTES // 8,), dtype=np.int64, buffer=self.shm.buf)
+        self.header[:] = 0
+        self.ring = np.ndarray((self.capacity,), dtype=np.uint8, buffer=self.shm.buf, offset=CAPTURE_HEADER_BYTES)
+        self.wrap_buffer = np.empty(0, dtype=np.uint8)
+        self.iq_buffer = np.empty(0, dtype=np.complex128)
+        self.overflows = 0
+        self.bytes_lost = 0
+        self.bytes_read = 0
+        self.closed = False
+        self.process = multiprocessing.Process(
+            target=capture_process_main,
+            args=(self.shm.name, self.capacity, sample_rate, center_freq, gain, chunk_bytes), daemon=True)
+        self.process.start()
+        deadline = time.time() + 15
+        while self.header[CAPTURE_STATUS] == CAPTURE_STARTING:
+            if time.time() > deadline or not self.process.is_alive():
+                self.close()
+                raise Exception("Capture process did not start")
+            time.sleep(0.01)
+        if self.header[CAPTURE_STATUS] == CAPTURE_FAILED:
+            self.close()
+            raise Exception("Capture process failed to open the SDR (see error log)")
+        self.read_position = int(self.header[CAPTURE_WRITE])
+        print(f"Capture process started with a {self.capacity / 2 / sample_rate:.1f}s shared ring buffer")
+
+    def flush(self):
+        # Skip everything captured so far, e.g. samples taken while the telescope was moving
+        self.read_position = int(self.header[CAPTURE_WRITE])
+
+    def read_bytes(self, num_bytes):
+        if num_bytes > self.capacity:
+            raise ValueError("Read is larger than the capture ring buffer")
+        deadline = time.time() + num_bytes / (2 * self.sample_rate) + 5
+        while True:
+            written = int(self.header[CAPTURE_WRITE])
+            if written - self.read_position > self.capacity - self.chunk_bytes:
+                # The writer has lapped (or is about to lap) us; keep only the newest data
+                lost = written - self.read_position - (self.capacity - self.chunk_bytes)
+                self.overflows += 1
+                self.bytes_lost += lost
+                self.read_position += lost
+                print(f"Warning: capture overflow, {lost / 2 / self.sample_rate:.3f}s of samples dropped")
+            if written - self.read_position >= num_bytes:
+                break
+            if self.header[CAPTURE_STATUS] == CAPTURE_FAILED or not self.process.is_alive():
+                raise Exception("Capture process stopped unexpectedly (see error log)")
+            if time.time() > deadline:
+                raise TimeoutError("Timed out waiting for samples from the capture process")
+            time.sleep(0.002)
+        position = self.read_position % self.capacity
+        self.read_position += num_bytes
+        self.bytes_read += num_bytes
+        if position + num_bytes <= self.capacity:
+            return self.ring[position:position + num_bytes]
+        if self.wrap_buffer.size != num_bytes:
+            self.wrap_buffer = np.empty(num_bytes, dtype=np.uint8)
+        first = self.capacity - position
+        self.wrap_buffer[:first] = self.ring[position:]
+        self.wrap_buffer[first:] = self.ring[:num_bytes - first]
+        return self.wrap_buffer
+
+    def read_samples(self, num_samples):
+        """Return num_samples complex samples in a buffer that is reused by the next call."""
+        raw = self.read_bytes(num_samples * 2)
+        if self.iq_buffer.size != num_samples:
+            self.iq_buffer = np.empty(num_samples, dtype=np.complex128)
+        floats = self.iq_buffer.view(np.float64)
+        np.multiply(raw, 1 / 127.5, out=floats)
+        floats -= 1.0
+        return self.iq_buffer
+
+    def stats(self):
+        return {'overflows': self.overflows, 'bytes_lost': self.bytes_lost, 'bytes_read': self.bytes_read}
+
+    def close(self):
+        # Closing again is a no-op, so error handlers need not know whether the scan already closed it
+        if self.closed:
+            return
+        self.closed = True
+        self.header[CAPTURE_STOP] = 1
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+        if self.overflows:
+            print(f"Capture overflows: {self.overflows} ({self.bytes_lost / 2 / self.sample_rate:.2f}s of samples dropped)")
+        del self.header, self.ring
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # A caller still holds a view of the ring; the memory is freed when it is released
+        self.shm.unlink()
+
+def open_sdr(sample_rate, center_frequency, gain, out_of_process=False):
+    if out_of_process:
+        try:
+            return SharedMemoryCapture(sample_rate, center_frequency, gain)
+        except Exception as e:
+            error_msg = f"Error starting capture process: {str(e)}"
+            print(error_msg)
+            log_error(error_msg)
+            raise
+    return setup_sdr(sample_rate, center_frequency, gain)
+
+def integrate_spectrum(sdr, duration, freq_range, spectrum_channels=None, num_samples=SAMPLES_PER_MEASUREMENT, timer=None, raw_recorder=None):
+    """
+    Read and average num_samples blocks from the SDR for about duration seconds.
+
+    Parameters:
+    - timer: Optional ScanTimer; sample reads are recorded as 'capture' and spectral work as 'fft'.
+    - raw_recorder: Optional RawIQRecorder with a point begun; the raw bytes read from the dongle are written to it.
+
+    Returns:
+    - power: Mean linear power within freq_range of center_freq.
+    - freqs, spectrum: Mean power spectrum binned to spectrum_channels, or None for both when no channels are asked for.
+    """
+    time_per_read = num_samples / sdr.sample_rate
+    num_reads = max(1, int(duration / time_per_read))
+    phase = timer.phase if timer is not None else (lambda name: contextlib.nullcontext())
+    if raw_recorder is not None:
+        raw_recorder.allocate(num_reads * num_samples * 2)
+    power = 0.0
+    binned_freqs = None
+    spectrum_sum = np.zeros(spectrum_channels) if spectrum_channels else None
+    for _ in range(num_reads):
+        with phase("capture"):
+            if raw_recorder is not None:
+                raw = np.frombuffer(sdr.read_bytes(num_samples * 2), dtype=np.uint8)
+                raw_recorder.write(raw)
+                samples = bytes_to_iq(raw)
+            else:
+                samples = sdr.read_samples(num_samples)
+        with phase("fft"):
+            freqs, power_spectrum = compute_power_spectrum(samples, sdr.sample_rate, sdr.center_freq)
+            power += integrate_band(freqs, power_spectrum, sdr.center_freq, freq_range)
+            if spectrum_sum is not None:
+                binned_freqs, binned = bin_spectrum(freqs, power_spectrum, spectrum_channels)
+                spectrum_sum += binned
+    return power / num_reads, binned_freqs, spectrum_sum / num_reads if spectrum_sum is not None else None
+
+def measure_point(sdr, readings_per_measurement, num_samples=SAMPLES_PER_MEASUREMENT, freq_range=10000, timer=None, raw_recorder=None, spectrum_channels=None):
     """
     Measure the hydrogen line power at the current position, averaging over multiple measurements.
     
@@ -163,49 +944,33 @@ def measure_point(sdr, readings_per_measurement, num_samples=256000, freq_range=
     - readings_per_measurement: Total averaging time in seconds (from GUI).
     - num_samples: Number of samples per individual measurement (default: 256,000).
     - freq_range: Frequency range (Hz) around center_freq to integrate (default: ±10 kHz).
+    - timer, raw_recorder: Passed on to integrate_spectrum.
+    - spectrum_channels: Optional number of channels to also average the power spectrum in.
     
     Returns:
     - hydrogen_line_power_db: Averaged power in dB.
+    - freqs, spectrum: The binned spectrum in linear units, or None for both without spectrum_channels.
     """
     try:
-        # Calculate number of measurements based on averaging time
-        time_per_measurement = num_samples / sdr.sample_rate  # Time for one measurement
-        num_measurements = max(1, int(readings_per_measurement / time_per_measurement))
-        print(f"Performing {num_measurements} measurements, each {time_per_measurement:.3f}s")
-        
-        power_values = []
-        for _ in range(num_measurements):
-            # Collect samples
-            samples = sdr.read_samples(num_samples)
-            # Compute FFT and power spectrum
-            fft_result = np.fft.fftshift(np.fft.fft(samples))
-            freqs = np.fft.fftshift(np.fft.fftfreq(len(samples), 1 / sdr.sample_rate)) + sdr.center_freq
-            power_spectrum = np.abs(fft_result) ** 2
-            # Select frequency range around center frequency
-            freq_mask = (sdr.center_freq - freq_range <= freqs) & (freqs <= sdr.center_freq + freq_range)
-            if not np.any(freq_mask):
-                raise ValueError("No frequencies in the specified range")
-            # Sum power in the selected frequency range (in linear units)
-            total_power = np.sum(power_spectrum[freq_mask])
-            power_values.append(total_power)
-        
-        # Average power in linear units
-        avg_power = np.mean(power_values)
+        print(f"Performing {max(1, int(readings_per_measurement / (num_samples / sdr.sample_rate)))} measurements, "
+              f"each {num_samples / sdr.sample_rate:.3f}s")
+        avg_power, freqs, spectrum = integrate_spectrum(sdr, readings_per_measurement, freq_range, spectrum_channels,
+                                                        num_samples, timer, raw_recorder)
         # Convert to dB, adding small constant to avoid log(0)
         hydrogen_line_power_db = 10 * np.log10(avg_power + 1e-10)
-        print(f"Averaged power: {hydrogen_line_power_db:.2f} dB from {num_measurements} measurements")
-        return hydrogen_line_power_db
+        print(f"Averaged power: {hydrogen_line_power_db:.2f} dB")
+        return hydrogen_line_power_db, freqs, spectrum
     except Exception as e:
         error_msg = f"Error measuring point: {str(e)}"
         print(error_msg)
         log_error(error_msg)
         raise
 
-def save_measurement(data: dict, folder: str):
+def save_measurement(data: dict, folder: str, file_name=None):
     try:
         if not os.path.exists(folder):
             os.makedirs(folder)
-        file_path = os.path.join(folder, datetime.now().strftime("%Y-%m-%d_%H-%M-%S.json"))
+        file_path = os.path.join(folder, file_name or datetime.now().strftime("%Y-%m-%d_%H-%M-%S.json"))
         with open(file_path, 'w') as file:
             json.dump(data, file)
     except Exception as e:
@@ -213,8 +978,23 @@ def save_measurement(data: dict, folder: str):
         print(error_msg)
         log_error(error_msg)
         raise
+    # Keep the folder's catalog current; a catalog failure must not lose the saved scan
+    try:
+        conn = open_catalog(folder)
+        try:
+            index_scan_file(conn, folder, file_path)
+            conn.commit()
+        finally:
+            conn.close()
+    except Exception as e:
+        error_msg = f"Error adding {file_path} to scan catalog: {str(e)}"
+        print(error_msg)
+        log_error(error_msg)
+    return file_path
 
-def initialize_plot(grid_width, grid_height, points):
+def initialize_plot(grid_width, grid_height, points, grid_spacing=None):
+    if grid_spacing is None:
+        grid_spacing = globals()['grid_spacing']
     fig, ax = plt.subplots(figsize=(4, 4))
     grid = np.full((grid_height, grid_width), np.nan)  # Initialize with NaN for unvisited points
     ra_values = [ra for ra, _ in points]
@@ -261,18 +1041,109 @@ def update_plot(ax, im, grid, ra, dec, intensity, points, grid_width, grid_heigh
     else:
         print(f"Warning: Point RA={ra:.2f}, Dec={dec:.2f} maps to invalid indices RA_idx={ra_idx}, Dec_idx={dec_idx}")
 
-def run_grid_scan(root, status_label, start_button, plot_frame, canvas_widget, fig, ax, im, grid, points):
-    global output_folder, grid_width, grid_height, grid_spacing, sdr_sample_rate, sdr_center_freq, sdr_gain, sdr_bandwidth, settle_time, telescope_progid, readings_per_measurement
+def format_timing_summary(summary):
+    lines = [f"Scan time: {summary['elapsed']:.1f}s for {summary['points']} points, "
+             f"efficiency {summary['efficiency'] * 100:.1f}% (time spent integrating)"]
+    for phase, total in summary['totals'].items():
+        share = total / summary['elapsed'] * 100 if summary['elapsed'] > 0 else 0
+        lines.append(f"  {phase:<8} {total:9.2f}s ({share:5.1f}%), {summary['per_point'][phase]:.3f}s per point")
+    lines.append(f"  {'other':<8} {summary['untracked']:9.2f}s")
+    return "\n".join(lines)
+
+def format_qc_summary(summary):
+    if not summary['points']:
+        return "No points measured yet"
+    quantiles = summary['quantiles']
+    std = f"{summary['std']:.2f}" if summary['std'] is not None else "-"
+    noise = f"{summary['noise']:.3f}" if summary['noise'] is not None else "-"
+    drift = f"{summary['drift_db_per_hour']:+.3f}" if summary['drift_db_per_hour'] is not None else "-"
+    flag_counts = {}
+    for entry in summary['flagged']:
+        if entry.get('RESOLVED'):
+            continue
+        for flag in entry['FLAGS']:
+            flag_counts[flag] = flag_counts.get(flag, 0) + 1
+    return "\n".join([
+        f"Points: {summary['points']}   Mean: {summary['mean']:.2f} dB   Std: {std} dB",
+        f"Median: {quantiles['0.5']:.2f} dB   5%-95%: {quantiles['0.05']:.2f} to {quantiles['0.95']:.2f} dB",
+        f"Noise (point to point): {noise} dB   Drift ({summary['drift_source']}): {drift} dB/hour",
+        f"Flagged: {summary['excluded']} (outliers {flag_counts.get('outlier', 0)}, RFI {flag_counts.get('rfi', 0)})"
+        f"   Re-measured: {summary['remeasured']}"])
+
+def show_qc_histogram(summary):
+    # Plot the scan's running histogram (the full data is not needed)
+    if not summary or not (summary['histogram'] or summary['excluded']):
+        messagebox.showinfo("Info", "No scan statistics yet")
+        return
+    edges = [float(edge) for edge in summary['histogram']]
+    plt.figure(figsize=(10, 6))
+    plt.bar(edges, list(summary['histogram'].values()), width=summary['histogram_bin_width'], align='edge', color='blue', edgecolor='black')
+    for entry in summary['flagged']:
+        if entry.get('RESOLVED'):
+            continue
+        plt.axvline(entry['INTENSITY'], color='red', linewidth=1)
+    plt.title('Distribution of Hydrogen Line Power Intensity (flagged points in red)')
+    plt.xlabel('Intensity (dB)')
+    plt.ylabel('Frequency')
+    plt.grid(True)
+    plt.show()
+
+def scan_settings():
+    # The Data Collection settings a grid scan runs with
+    return {
+        'output_folder': output_folder,
+        'telescope_progid': telescope_progid,
+        'grid_width': grid_width,
+        'grid_height': grid_height,
+        'grid_spacing': grid_spacing,
+        'sdr_sample_rate': sdr_sample_rate,
+        'sdr_center_freq': sdr_center_freq,
+        'sdr_gain': sdr_gain,
+        'sdr_bandwidth': sdr_bandwidth,
+        'settle_time': settle_time,
+        'readings_per_measurement': readings_per_measurement,
+        'spectrum_channels': spectrum_channels,
+        'record_raw_iq': record_raw_iq,
+        'capture_out_of_process': capture_out_of_process
+    }
+
+def run_grid_scan(root, status_label, start_button, plot_frame, canvas_widget, fig, ax, im, grid, points, efficiency_label=None, refiner=None, qc_label=None, qc_control=None,
+                  telescope=None, sdr=None, clock=time.perf_counter, measure=measure_point, settings=None):
+    """
+    Run a grid scan over points, driven by root.after callbacks. telescope, sdr, clock and measure
+    are normally left out; the survey planner passes simulated ones to dry-run the scan.
+    settings overrides entries of scan_settings() for this scan only.
+    """
+    settings = dict(scan_settings(), **(settings or {}))
+    opened_sdr = sdr is None
+    output_folder, telescope_progid = settings['output_folder'], settings['telescope_progid']
+    grid_width, grid_height, grid_spacing = settings['grid_width'], settings['grid_height'], settings['grid_spacing']
+    sdr_sample_rate, sdr_center_freq = settings['sdr_sample_rate'], settings['sdr_center_freq']
+    sdr_gain, sdr_bandwidth = settings['sdr_gain'], settings['sdr_bandwidth']
+    settle_time, readings_per_measurement = settings['settle_time'], settings['readings_per_measurement']
+    spectrum_channels, record_raw_iq = settings['spectrum_channels'], settings['record_raw_iq']
+    capture_out_of_process = settings['capture_out_of_process']
     try:
+        timer = ScanTimer(clock)
         # Connect to telescope and get current position
-        telescope = connect_to_telescope(telescope_progid)
+        timer.start("connect")
+        if telescope is None:
+            telescope = connect_to_telescope(telescope_progid)
         initial_ra, initial_dec = get_current_position(telescope)
         print(f"Retrieved initial position - RA: {initial_ra:.2f} degrees, Dec: {initial_dec:.2f} degrees")
         status_label.config(text=f"Initial Position - RA: {initial_ra:.2f} deg, Dec: {initial_dec:.2f} deg")
         root.update_idletasks()
 
         # Generate grid points centered on current position
-        sdr = setup_sdr(sdr_sample_rate, sdr_center_freq, sdr_gain)
+        if sdr is None:
+            sdr = open_sdr(sdr_sample_rate, sdr_center_freq, sdr_gain, capture_out_of_process)
+
+        def stop_capture():
+            # A failed scan must not leave the capture process streaming the dongle
+            if isinstance(sdr, SharedMemoryCapture):
+                sdr.close()
+        prepare_fft()
+        timer.stop("connect")
         measurements = {
             'sample_rate': sdr_sample_rate,
             'center_frequency': sdr_center_freq,
@@ -282,14 +1153,51 @@ def run_grid_scan(root, status_label, start_button, plot_frame, canvas_widget, f
             'grid_height': grid_height,
             'grid_spacing': grid_spacing,
             'initial_ra': initial_ra,
-            'initial_dec': initial_dec
+            'initial_dec': initial_dec,
+            'fft_backend': fft_backend
         }
+        if refiner is not None:
+            measurements['scan_mode'] = 'adaptive'
+            measurements['refine_threshold'] = refiner.threshold
         readings = []
+        monitor = ScanQualityMonitor()
+        remeasure_targets = {}  # Index in points -> index of the flagged reading it replaces
+        if qc_control is None:
+            qc_control = {}
+        raw_recorder = None
+        if record_raw_iq:
+            start_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            raw_header = dict(measurements, num_samples=SAMPLES_PER_MEASUREMENT, start_time=start_time)
+            raw_recorder = RawIQRecorder(os.path.join(output_folder, f"raw_{start_time}"), raw_header)
+            measurements['raw_folder'] = f"raw_{start_time}"
+            print(f"Recording raw IQ to {raw_recorder.folder}")
 
         def process_point(i):
-            if i >= len(points):
+            aborted = qc_control.get('abort', False)
+            if qc_control.get('remeasure') and not aborted:
+                qc_control['remeasure'] = False
+                for entry in monitor.take_flagged():
+                    remeasure_targets[len(points)] = entry['index']
+                    points.append((entry['RA'], entry['DEC']))
+                    print(f"Queued flagged point RA: {entry['RA']:.2f}, Dec: {entry['DEC']:.2f} for re-measuring")
+            if i >= len(points) and refiner is not None and not aborted:
+                # Adaptive mode: ask for the next batch once the current one is measured
+                points.extend(refiner(readings))
+            if i >= len(points) or aborted:
+                if aborted:
+                    print(f"Scan aborted after {len(readings)} points; saving the points measured so far.")
+                    measurements['aborted'] = True
                 measurements['measurements'] = readings
-                save_measurement(measurements, output_folder)
+                measurements['qc'] = monitor.summary()
+                if isinstance(sdr, SharedMemoryCapture):
+                    measurements['capture_stats'] = sdr.stats()
+                with timer.phase("save"):
+                    file_path = save_measurement(measurements, output_folder)
+                # The summary can only include the save once it is done, so the file is written again
+                # with it; that second write is not counted
+                measurements['timing_summary'] = timer.summary()
+                save_measurement(measurements, output_folder, os.path.basename(file_path))
+                print(format_timing_summary(measurements['timing_summary']))
                 slew_to(telescope, initial_ra, initial_dec)
                 status_label.config(text="Grid scan completed. Returning to initial position.")
                 root.update_idletasks()
@@ -305,12 +1213,14 @@ def run_grid_scan(root, status_label, start_button, plot_frame, canvas_widget, f
             print(f"Grid Position {i + 1} out of {grid_width*grid_height}: Slewing to RA: {ra:.2f} deg, Dec: {dec:.2f} deg")
             root.update_idletasks()
             try:
+                timer.start("slew")
                 slew_to(telescope, ra, dec)
             except Exception as e:
                 error_msg = f"Failed to slew to position {i + 1}: {str(e)}"
                 print(error_msg)
                 log_error(error_msg)
                 status_label.config(text="Error: Slew failed. Check log.")
+                stop_capture()
                 start_button.config(state="normal")
                 for widget in plot_frame.winfo_children():
                     widget.destroy()
@@ -326,11 +1236,14 @@ def run_grid_scan(root, status_label, start_button, plot_frame, canvas_widget, f
                         print(error_msg)
                         log_error(error_msg)
                         status_label.config(text="Error: Slew timeout. Check log.")
+                        stop_capture()
                         start_button.config(state="normal")
                         for widget in plot_frame.winfo_children():
                             widget.destroy()
                         messagebox.showerror("Error", error_msg)
                     else:
+                        timer.stop("slew")
+                        timer.start("settle")
                         status_label.config(text=f"Settling for {settle_time}s at Position {i + 1}/{grid_width*grid_height}")
                         root.update_idletasks()
                         root.after(int(settle_time * 1000), lambda: measure_and_proceed(i))
@@ -339,6 +1252,7 @@ def run_grid_scan(root, status_label, start_button, plot_frame, canvas_widget, f
                     print(error_msg)
                     log_error(error_msg)
                     status_label.config(text="Error: Operation failed. Check log.")
+                    stop_capture()
                     start_button.config(state="normal")
                     for widget in plot_frame.winfo_children():
                         widget.destroy()
@@ -346,25 +1260,62 @@ def run_grid_scan(root, status_label, start_button, plot_frame, canvas_widget, f
 
             def measure_and_proceed(i):
                 try:
+                    timer.stop("settle")
                     status_label.config(text=f"Measuring at Position {i + 1}/{grid_width*grid_height}: RA: {ra:.2f}, Dec: {dec:.2f}")
                     root.update_idletasks()
                     # Updated call to measure_point with readings_per_measurement and sdr_bandwidth
-                    hydrogen_line_power_db = measure_point(sdr, readings_per_measurement, freq_range=sdr_bandwidth)
-                    readings.append({
+                    if isinstance(sdr, SharedMemoryCapture):
+                        sdr.flush()  # Drop samples captured while slewing and settling
+                    if raw_recorder is not None:
+                        raw_recorder.begin_point(ra, dec, remeasure_targets.get(i))
+                    hydrogen_line_power_db, spectrum_freqs, spectrum = measure(
+                        sdr, readings_per_measurement, freq_range=sdr_bandwidth, timer=timer,
+                        raw_recorder=raw_recorder, spectrum_channels=spectrum_channels or None)
+                    if spectrum is not None:
+                        measurements.setdefault('spectrum_frequencies', spectrum_freqs.tolist())
+                    if raw_recorder is not None:
+                        raw_recorder.end_point(hydrogen_line_power_db)
+                    reading = {
                         'RA': ra,
                         'DEC': dec,
                         'INTENSITY': hydrogen_line_power_db,
                         'TIME': datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-                    })
+                    }
+                    if spectrum is not None:
+                        reading['SPECTRUM'] = spectrum.tolist()
+                    if i in remeasure_targets:
+                        # Replace the flagged reading so images use the new value
+                        index = remeasure_targets.pop(i)
+                        reading['REMEASURED'] = True
+                        reading['PREVIOUS_INTENSITY'] = readings[index]['INTENSITY']
+                        readings[index] = reading
+                        monitor.resolve(index)
+                        if refiner is not None:
+                            refiner.replace(reading)
+                    else:
+                        index = len(readings)
+                        readings.append(reading)
+                    flags = monitor.add(index, ra, dec, hydrogen_line_power_db, time.time(), spectrum)
+                    if flags:
+                        reading['QC_FLAG'] = flags
+                        print(f"Quality warning at RA: {ra:.2f}, Dec: {dec:.2f}: {', '.join(flags)}")
+                    qc_control['summary'] = monitor.summary()
+                    if qc_label is not None:
+                        qc_label.config(text=format_qc_summary(qc_control['summary']))
                     print(f'\nData recorded at position {i + 1} out of {grid_width*grid_height}: \nRA: {ra:.2f} deg, \nDec: {dec:.2f} deg, \nHydrogen Line Strength: {hydrogen_line_power_db:.2f} dB\n\n')
                     # Update the live plot
-                    update_plot(ax, im, grid, ra, dec, hydrogen_line_power_db, points, grid_width, grid_height, canvas_widget)
+                    with timer.phase("plot"):
+                        update_plot(ax, im, grid, ra, dec, hydrogen_line_power_db, points, grid_width, grid_height, canvas_widget)
+                    reading['TIMING'] = timer.end_point()
+                    if efficiency_label is not None:
+                        efficiency_label.config(text=f"Efficiency: {timer.efficiency() * 100:.1f}% integrating")
                     root.after(100, process_point, i + 1)
                 except Exception as e:
                     error_msg = f"Error during measurement at position {i + 1}: {str(e)}"
                     print(error_msg)
                     log_error(error_msg)
                     status_label.config(text="Error: Operation failed. Check log.")
+                    stop_capture()
                     start_button.config(state="normal")
                     for widget in plot_frame.winfo_children():
                         widget.destroy()
@@ -378,21 +1329,239 @@ def run_grid_scan(root, status_label, start_button, plot_frame, canvas_widget, f
         print(error_msg)
         log_error(error_msg)
         status_label.config(text="Error occurred. Check log.")
+        # Setup can fail after the SDR or capture process was opened; release it for the next scan
+        if opened_sdr and sdr is not None:
+            sdr.close()
         start_button.config(state="normal")
         for widget in plot_frame.winfo_children():
             widget.destroy()
         messagebox.showerror("Error", f"Scan failed: {str(e)}")
 
-# Image Assembly functions
-def extract_data_from_file(file_path):
-    with open(file_path, 'r') as file:
-        data = json.load(file)
+# Time Series functions
+class TimeSeriesDecimator:
+    """
+    Average a stream of integrations into several time resolutions at once and write each
+    resolution to disk in fixed-size chunks, so memory use stays flat however long the run is.
 
-    measurements = data.get('measurements', [])
-    grid_spacing = data.get('grid_spacing', None)
-    grid_width = data.get('grid_width', None)
-    grid_height = data.get('grid_height', None)
+    Each level averages 'factor' consecutive integrations into one row. Rows collect in
+    preallocated buffers of chunk_rows and are saved as level_<factor>x/chunk_<n>.npz.
+    RA must be passed unwrapped (it may run past 360) so rows spanning RA 0 average
+    correctly; it is wrapped to 0-360 when each row is written.
+    """
+    def __init__(self, folder, channels, levels=TIME_SERIES_LEVELS, chunk_rows=TIME_SERIES_CHUNK_ROWS):
+        self.folder = folder
+        self.channels = channels
+        self.chunk_rows = chunk_rows
+        self.levels = []
+        for factor in levels:
+            os.makedirs(os.path.join(folder, f"level_{factor}x"), exist_ok=True)
+            self.levels.append({
+                'factor': factor,
+                'count': 0,
+                'sums': np.zeros(3),  # time, RA, linear power
+                'spectrum_sum': np.zeros(channels),
+                'rows': 0,
+                'chunk': 0,
+                'buffer': np.zeros((chunk_rows, 3)),
+                'spectra': np.zeros((chunk_rows, channels), dtype=np.float32)
+            })
+
+    def add(self, timestamp, ra, power, spectrum):
+        """Add one integration; returns the rows (time, RA, power in dB) completed at each level."""
+        completed = {}
+        for level in self.levels:
+            level['sums'] += (timestamp, ra, power)
+            level['spectrum_sum'] += spectrum
+            level['count'] += 1
+            if level['count'] == level['factor']:
+                row = level['sums'] / level['count']
+                level['buffer'][level['rows']] = (row[0], row[1] % 360, linear_to_dB(row[2] + 1e-10))
+                level['spectra'][level['rows']] = level['spectrum_sum'] / level['count']
+                completed[level['factor']] = tuple(level['buffer'][level['rows']])
+                level['rows'] += 1
+                level['count'] = 0
+                level['sums'][:] = 0
+                level['spectrum_sum'][:] = 0
+                if level['rows'] == self.chunk_rows:
+                    self.write_chunk(level)
+        return completed
+
+    def write_chunk(self, level):
+        if level['rows'] == 0:
+            return
+        level['chunk'] += 1
+        rows = level['rows']
+        np.savez(os.path.join(self.folder, f"level_{level['factor']}x", f"chunk_{level['chunk']:05d}.npz"),
+                 time=level['buffer'][:rows, 0], ra=level['buffer'][:rows, 1], power_db=level['buffer'][:rows, 2],
+                 spectrum=level['spectra'][:rows])
+        level['rows'] = 0
+
+    def flush(self):
+        # Write partially filled chunks; integrations not yet forming a full row are dropped
+        for level in self.levels:
+            self.write_chunk(level)
+
+def read_time_series(folder, factor):
+    # Concatenate every chunk of one decimation level
+    chunks = sorted(glob.glob(os.path.join(folder, f"level_{factor}x", "chunk_*.npz")))
+    if not chunks:
+        raise ValueError(f"No data found for level {factor}x in {folder}")
+    parts = {'time': [], 'ra': [], 'power_db': [], 'spectrum': []}
+    for chunk in chunks:
+        with np.load(chunk) as data:
+            for key in parts:
+                parts[key].append(data[key])
+    return {key: np.concatenate(values) for key, values in parts.items()}
+
+def initialize_strip_chart():
+    fig, ax = plt.subplots(figsize=(5, 3))
+    line, = ax.plot([], [], color='tab:blue', linewidth=1)
+    ax.set_title('Live Total Power')
+    ax.set_xlabel('Time Since Start (hours)')
+    ax.set_ylabel('Intensity (dB)')
+    ax.grid(True)
+    fig.tight_layout()
+    return fig, ax, line
+
+def run_time_series(root, status_label, start_button, stop_button, plot_frame, canvas_widget, ax, line, settings, control):
+    """
+    Hold or drift at one pointing and stream total power and spectra until the duration ends or
+    Stop is pressed. settings holds the values read from the Time Series frame.
+    """
+    def fail(error_msg):
+        print(error_msg)
+        log_error(error_msg)
+        status_label.config(text="Error: Operation failed. Check log.")
+        start_button.config(state="normal")
+        stop_button.config(state="disabled")
+        for widget in plot_frame.winfo_children():
+            widget.destroy()
+        messagebox.showerror("Error", error_msg)
 
+    sdr = None
+    try:
+        telescope = connect_to_telescope(settings['progid'])
+        ra, dec = settings['ra'], settings['dec']
+        if ra is None or dec is None:
+            ra, dec = get_current_position(telescope)
+        drift = settings['mode'] == TIME_SERIES_MODES[1]
+        sdr = open_sdr(settings['sample_rate'], settings['center_freq'], settings['gain'], settings['out_of_process'])
+        prepare_fft()
+        start_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        folder = os.path.join(settings['output_folder'], f"timeseries_{start_time}")
+        decimator = TimeSeriesDecimator(folder, settings['channels'])
+        info = {
+            'mode': 'drift' if drift else 'hold',
+            'ra': ra,
+            'dec': dec,
+            'start_time': start_time,
+            'sample_rate': settings['sample_rate'],
+            'center_frequency': settings['center_freq'],
+            'gain': settings['gain'],
+            'bandwidth': settings['bandwidth'],
+            'integration_time': settings['integration_time'],
+            'levels': list(TIME_SERIES_LEVELS),
+            'fft_backend': fft_backend
+        }
+        strip_times = deque(maxlen=STRIP_CHART_POINTS)
+        strip_powers = deque(maxlen=STRIP_CHART_POINTS)
+    except Exception as e:
+        if sdr is not None:
+            sdr.close()  # Do not leave the dongle or capture process open when setup fails after opening it
+        fail(f"Error starting time series: {str(e)}\n{traceback.format_exc()}")
+        return
+
+    def save_info():
+        with open(os.path.join(folder, "timeseries_info.json"), 'w') as file:
+            json.dump(info, file)
+
+    def finish(message):
+        decimator.flush()
+        info['end_time'] = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        if isinstance(sdr, SharedMemoryCapture):
+            info['capture_stats'] = sdr.stats()
+        save_info()
+        sdr.close()
+        print(f"{message} Data saved to {folder}")
+        status_label.config(text=message)
+        start_button.config(state="normal")
+        stop_button.config(state="disabled")
+
+    def step():
+        try:
+            if control['stop'] or time.time() >= control['end']:
+                finish("Time series stopped." if control['stop'] else "Time series completed.")
+                return
+            power, freqs, spectrum = integrate_spectrum(sdr, settings['integration_time'], settings['bandwidth'], settings['channels'])
+            timestamp = time.time()
+            if 'spectrum_frequencies' not in info:
+                info['spectrum_frequencies'] = freqs.tolist()
+                save_info()
+            # With tracking off the beam stays at a fixed hour angle, so its RA grows at the sidereal rate
+            beam_ra = ra + SIDEREAL_RATE * (timestamp - control['start']) / 3600 if drift else ra
+            decimator.add(timestamp, beam_ra, power, spectrum)
+            beam_ra %= 360
+            strip_times.append((timestamp - control['start']) / 3600)
+            strip_powers.append(linear_to_dB(power + 1e-10))
+            line.set_data(strip_times, strip_powers)
+            ax.relim()
+            ax.autoscale_view()
+            canvas_widget.draw_idle()
+            remaining = max(0, control['end'] - timestamp)
+            status_label.config(text=f"Recording: {strip_powers[-1]:.2f} dB, RA {beam_ra:.2f}, {format_duration(remaining)} left")
+            root.after(1, step)
+        except Exception as e:
+            try:
+                decimator.flush()
+                save_info()
+                sdr.close()
+            except Exception:
+                pass
+            fail(f"Error during time series: {str(e)}")
+
+    def begin_recording():
+        try:
+            if drift:
+                telescope.Tracking = False
+                print("Tracking turned off for drift scan.")
+            else:
+                telescope.Tracking = True
+            control['start'] = time.time()
+            control['end'] = control['start'] + settings['duration_hours'] * 3600
+            print(f"Recording {'drift scan' if drift else 'time series'} at RA: {ra:.2f} deg, Dec: {dec:.2f} deg to {folder}")
+            save_info()
+            if isinstance(sdr, SharedMemoryCapture):
+                sdr.flush()  # Start from samples taken at the target, not during the slew
+            step()
+        except Exception as e:
+            sdr.close()
+            fail(f"Error starting time series: {str(e)}")
+
+    def wait_for_slew(elapsed=0):
+        try:
+            if telescope.Slewing and elapsed < 30000:
+                root.after(100, wait_for_slew, elapsed + 100)
+            elif elapsed >= 30000:
+                sdr.close()
+                fail("Timeout waiting for slew to time series pointing")
+            else:
+                root.after(int(settings['settle_time'] * 1000), begin_recording)
+        except Exception as e:
+            sdr.close()
+            fail(f"Error during slew: {str(e)}")
+
+    status_label.config(text=f"Slewing to RA: {ra:.2f}, Dec: {dec:.2f}")
+    root.update_idletasks()
+    try:
+        slew_to(telescope, ra, dec)
+    except Exception as e:
+        sdr.close()
+        fail(f"Failed to slew to time series pointing: {str(e)}")
+        return
+    root.after(100, wait_for_slew, 0)
+
+# Image Assembly functions
+def parse_measurements(measurements):
     results = []
     for measurement in measurements:
         ra = measurement.get('RA')
@@ -402,14 +1571,15 @@ def extract_data_from_file(file_path):
             results.append((ra, dec, power))
         else:
             raise ValueError("Data format in file is incorrect or missing some values")
-    return results, grid_spacing, grid_width, grid_height
+    return results
 
 def read_data_from_file(file_path):
     data_points = []
     grid_spacings = []
     try:
-        measurements, grid_spacing, _, _ = extract_data_from_file(file_path)
-        data_points.extend(measurements)
+        points_array, header = load_scan_array(file_path)
+        data_points.extend(map(tuple, points_array.tolist()))
+        grid_spacing = header.get('grid_spacing')
         if grid_spacing is not None:
             grid_spacings.append(grid_spacing)
     except ValueError as e:
@@ -433,7 +1603,47 @@ def plot_intensity_distribution(power_values):
     plt.grid(True)
     plt.show()
 
-def generate_image(data_points, grid_spacing):
+def fill_grid_gaps(grid):
+    # Give each empty cell the value of the nearest measured cell (used for adaptive scans)
+    filled = ~np.isnan(grid)
+    if filled.all() or not filled.any():
+        return grid
+    if scipy_ndimage is not None:
+        _, (nearest_y, nearest_x) = scipy_ndimage.distance_transform_edt(~filled, return_indices=True)
+        return grid[nearest_y, nearest_x]
+    # Without SciPy, search the measured cells for a block of empty cells at a time to bound memory
+    measured_y, measured_x = np.nonzero(filled)
+    empty_y, empty_x = np.nonzero(~filled)
+    grid = grid.copy()
+    for start in range(0, len(empty_y), 1024):
+        block_y, block_x = empty_y[start:start + 1024], empty_x[start:start + 1024]
+        distances = (block_y[:, None] - measured_y[None, :]) ** 2 + (block_x[:, None] - measured_x[None, :]) ** 2
+        nearest = np.argmin(distances, axis=1)
+        grid[block_y, block_x] = grid[measured_y[nearest], measured_x[nearest]]
+    return grid
+
+def fill_scan_lattice(points, spacing):
+    """
+    Fill the unmeasured cells of one adaptive scan's own lattice with the nearest measured power.
+
+    Returns the scan's (RA, Dec, power) rows with one extra row per filled cell, so the scan can be
+    combined with other scans without filling gaps outside its own footprint.
+    """
+    ra_ref, dec_min = points[0, 0], points[:, 1].min()
+    ra_offsets = (points[:, 0] - ra_ref + 180) % 360 - 180
+    ix = np.rint((ra_offsets - ra_offsets.min()) / spacing).astype(int)
+    iy = np.rint((points[:, 1] - dec_min) / spacing).astype(int)
+    grid = np.full((iy.max() + 1, ix.max() + 1), np.nan)
+    grid[iy, ix] = points[:, 2]
+    empty_y, empty_x = np.nonzero(np.isnan(grid))
+    if len(empty_y) == 0:
+        return points
+    filled = fill_grid_gaps(grid)
+    extra = np.column_stack([(ra_ref + ra_offsets.min() + empty_x * spacing) % 360, dec_min + empty_y * spacing,
+                             filled[empty_y, empty_x]])
+    return np.vstack([points, extra])
+
+def generate_image(data_points, grid_spacing, fill_gaps=False):
     ra_values = [ra for ra, dec, power in data_points]
     dec_values = [dec for ra, dec, power in data_points]
 
@@ -455,6 +1665,9 @@ def generate_image(data_points, grid_spacing):
         else:
             grid[dec_idx, ra_idx] = (grid[dec_idx, ra_idx] + power) / 2
 
+    if fill_gaps:
+        grid = fill_grid_gaps(grid)
+
     plt.figure(figsize=(10, 8))
     plt.imshow(grid, cmap='viridis', interpolation='nearest', origin='lower',
                extent=[min(ra_values), max(ra_values), min(dec_values), max(dec_values)])
@@ -464,6 +1677,600 @@ def generate_image(data_points, grid_spacing):
     plt.ylabel('Declination')
     plt.show()
 
+# Scan catalog functions
+def get_cache_path(file_path):
+    folder, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(folder, CACHE_FOLDER_NAME, os.path.splitext(name)[0] + ".npz")
+
+def load_scan_array(file_path):
+    """
+    Load the (RA, DEC, INTENSITY) rows of a scan file as an N x 3 array, using a binary sidecar cache.
+
+    The sidecar lives in a cache folder next to the scan file and is rebuilt whenever the
+    scan file's modification time no longer matches the one stored in the sidecar.
+
+    Returns:
+    - points: float64 array of shape (N, 3).
+    - header: Dictionary of the scan's top-level settings (everything except 'measurements').
+    """
+    mtime = os.path.getmtime(file_path)
+    cache_path = get_cache_path(file_path)
+    if os.path.exists(cache_path):
+        try:
+            with np.load(cache_path, allow_pickle=False) as cache:
+                if float(cache['mtime']) == mtime:
+                    return cache['points'], json.loads(str(cache['header']))
+        except Exception as e:
+            print(f"Ignoring unreadable cache {cache_path}: {str(e)}")
+
+    with open(file_path, 'r') as file:
+        data = json.load(file)
+    # Only scan files are cached; other JSON files (e.g. timeseries_info.json) are rejected here
+    if not isinstance(data, dict) or not isinstance(data.get('measurements'), list):
+        raise ValueError("Not a scan file (no measurements list)")
+    if not all(isinstance(measurement, dict) for measurement in data['measurements']):
+        raise ValueError("Data format in file is incorrect or missing some values")
+    points = np.array(parse_measurements(data['measurements']), dtype=np.float64).reshape(-1, 3)
+    header = {key: value for key, value in data.items() if key != 'measurements'}
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        np.savez(cache_path, points=points, mtime=np.float64(mtime), header=np.array(json.dumps(header)))
+    except Exception as e:
+        error_msg = f"Error writing cache for {file_path}: {str(e)}"
+        print(error_msg)
+        log_error(error_msg)
+    return points, header
+
+def get_scan_time(file_path):
+    # Scan files are named after the time they were saved; fall back to the file's mtime
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    try:
+        return datetime.strptime(stem[:19], "%Y-%m-%d_%H-%M-%S").strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        pass
+    return datetime.fromtimestamp(os.path.getmtime(file_path)).strftime("%Y-%m-%d %H:%M:%S")
+
+def open_catalog(folder):
+    conn = sqlite3.connect(os.path.join(folder, CATALOG_FILENAME))
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS scans (
+            path TEXT PRIMARY KEY,
+            mtime REAL,
+            scan_time TEXT,
+            center_ra REAL,
+            center_dec REAL,
+            ra_min REAL,
+            ra_max REAL,
+            dec_min REAL,
+            dec_max REAL,
+            center_frequency REAL,
+            sample_rate REAL,
+            gain REAL,
+            bandwidth REAL,
+            grid_spacing REAL,
+            num_points INTEGER
+        )""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_scans_time ON scans (scan_time)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_scans_footprint ON scans (ra_min, ra_max, dec_min, dec_max)")
+    return conn
+
+def index_scan_file(conn, folder, file_path):
+    """
+    Add or refresh a single scan file in the catalog. Returns True if the entry was (re)indexed,
+    False if the catalog was already up to date for the file's modification time.
+    """
+    rel_path = os.path.relpath(file_path, folder)
+    mtime = os.path.getmtime(file_path)
+    row = conn.execute("SELECT mtime FROM scans WHERE path = ?", (rel_path,)).fetchone()
+    if row is not None and row['mtime'] == mtime:
+        return False
+
+    points, header = load_scan_array(file_path)
+    if points.shape[0] == 0:
+        raise ValueError("Scan file contains no measurements")
+    spacing = header.get('grid_spacing') or 0
+    # Measure RA relative to the first point so a scan across RA 0 gets a narrow footprint.
+    # ra_min is stored in 0-360 and ra_max may run past 360 for such scans.
+    ra_ref = points[0, 0]
+    ra_offsets = (points[:, 0] - ra_ref + 180) % 360 - 180
+    ra_min = ra_ref + ra_offsets.min() - spacing / 2
+    ra_max = ra_ref + ra_offsets.max() + spacing / 2
+    wrap = math.floor(ra_min / 360) * 360
+    ra_min, ra_max = ra_min - wrap, ra_max - wrap
+    dec_min, dec_max = points[:, 1].min() - spacing / 2, points[:, 1].max() + spacing / 2
+    center_ra = header.get('initial_ra', ((ra_min + ra_max) / 2) % 360)
+    center_dec = header.get('initial_dec', (dec_min + dec_max) / 2)
+    conn.execute(
+        "INSERT OR REPLACE INTO scans VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (rel_path, mtime, get_scan_time(file_path), center_ra, center_dec,
+         ra_min, ra_max, dec_min, dec_max, header.get('center_frequency'), header.get('sample_rate'),
+         header.get('gain'), header.get('bandwidth'), header.get('grid_spacing'), int(points.shape[0])))
+    return True
+
+def update_catalog(folder):
+    """
+    Index every scan file under folder and drop entries for files that no longer exist.
+
+    Returns:
+    - (indexed, removed): Number of entries added or refreshed, and number of entries removed.
+    """
+    conn = open_catalog(folder)
+    try:
+        indexed = 0
+        seen = set()
+        for file_path in glob.glob(os.path.join(folder, "**", "*.json"), recursive=True):
+            if os.path.basename(file_path) == RAW_INDEX_FILENAME:
+                continue
+            seen.add(os.path.relpath(file_path, folder))
+            try:
+                if index_scan_file(conn, folder, file_path):
+                    indexed += 1
+            except (ValueError, KeyError, json.JSONDecodeError) as e:
+                print(f"Skipping file {file_path}: {e}")
+            except Exception as e:
+                # One unreadable file must not stop the rest of the folder from being indexed
+                error_msg = f"Skipping file {file_path}: {str(e)}"
+                print(error_msg)
+                log_error(error_msg)
+        stale = [row['path'] for row in conn.execute("SELECT path FROM scans") if row['path'] not in seen]
+        conn.executemany("DELETE FROM scans WHERE path = ?", [(path,) for path in stale])
+        conn.commit()
+        print(f"Catalog updated: {indexed} scans indexed, {len(stale)} removed")
+        return indexed, len(stale)
+    finally:
+        conn.close()
+
+def query_scans(folder, ra_min=None, ra_max=None, dec_min=None, dec_max=None, since=None, until=None,
+                center_frequency=None, gain=None):
+    """
+    Find catalogued scans whose footprint overlaps the given region.
+
+    Any argument left as None is not used as a filter. RA bounds may wrap through 0 (e.g.
+    ra_min=350, ra_max=10). since/until accept a datetime or a 'YYYY-MM-DD[ HH:MM:SS]' string
+    and are compared against the scan time.
+
+    Returns:
+    - List of dictionaries, one per scan, ordered by scan time, with 'path' made absolute.
+    """
+    conditions = []
+    params = []
+    if ra_min is not None or ra_max is not None:
+        # Footprints run from ra_min in 0-360 up to ra_max < 720, so test the query range
+        # shifted by a turn either way as well
+        start = (ra_min if ra_min is not None else 0) % 360
+        end = (ra_max if ra_max is not None else 360) % 360 or 360
+        if end < start:
+            end += 360
+        conditions.append("(" + " OR ".join(["(ra_max >= ? AND ra_min <= ?)"] * 3) + ")")
+        for shift in (-360, 0, 360):
+            params.extend((start + shift, end + shift))
+    for column, operator, value in (
+        ("dec_max", ">=", dec_min), ("dec_min", "<=", dec_max),
+        ("center_frequency", "=", center_frequency), ("gain", "=", gain)):
+        if value is not None:
+            conditions.append(f"{column} {operator} ?")
+            params.append(value)
+    for operator, value in ((">=", since), ("<=", until)):
+        if value is not None:
+            if isinstance(value, datetime):
+                value = value.strftime("%Y-%m-%d %H:%M:%S")
+            conditions.append(f"scan_time {operator} ?")
+            params.append(value)
+    query = "SELECT * FROM scans"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY scan_time"
+
+    conn = open_catalog(folder)
+    try:
+        results = []
+        for row in conn.execute(query, params):
+            scan = dict(row)
+            scan['path'] = os.path.join(folder, scan['path'])
+            results.append(scan)
+        return results
+    finally:
+        conn.close()
+
+def load_catalog_data(scans):
+    # Combine the cached arrays of several catalogued scans for generate_image. Adaptive scans
+    # have the gaps in their own lattice filled first, so empty sky between scans stays empty.
+    data_points = []
+    grid_spacings = []
+    for scan in scans:
+        points, header = load_scan_array(scan['path'])
+        if header.get('grid_spacing') is not None:
+            grid_spacings.append(header['grid_spacing'])
+            if header.get('scan_mode') == 'adaptive' and points.shape[0] > 0:
+                points = fill_scan_lattice(points, header['grid_spacing'])
+        data_points.extend(map(tuple, points.tolist()))
+    average_spacing = sum(grid_spacings) / len(grid_spacings) if grid_spacings else None
+    return data_points, average_spacing
+
+# Field co-adding functions
+def create_field_accumulator(ra0, dec0, spacing, spectrum_frequencies=None):
+    accumulator = {
+        'ra0': np.float64(ra0),
+        'dec0': np.float64(dec0),
+        'spacing': np.float64(spacing),
+        'sum': np.zeros((1, 1)),
+        'sumsq': np.zeros((1, 1)),
+        'weight': np.zeros((1, 1)),
+        'merged': np.array([], dtype=str)
+    }
+    if spectrum_frequencies is not None:
+        accumulator['spectrum_frequencies'] = np.asarray(spectrum_frequencies, dtype=np.float64)
+        accumulator['channel_sum'] = np.zeros((len(spectrum_frequencies), 1, 1))
+        accumulator['channel_weight'] = np.zeros((1, 1))
+    return accumulator
+
+def load_field_accumulator(path):
+    with np.load(path, allow_pickle=False) as data:
+        return {key: data[key] for key in data.files}
+
+def save_field_accumulator(path, accumulator):
+    # Write to a temporary file first so an interrupted save never corrupts the field
+    temp_path = path + ".tmp.npz"
+    np.savez(temp_path, **accumulator)
+    os.replace(temp_path, path)
+
+def grow_field_accumulator(accumulator, ix, iy):
+    """
+    Pad the accumulator's cell arrays so the cell indices ix/iy fit, moving the origin when
+    cells fall below index 0. Returns the indices shifted into the grown arrays.
+    """
+    height, width = accumulator['weight'].shape
+    pad_left, pad_bottom = max(0, -int(ix.min())), max(0, -int(iy.min()))
+    pad_right, pad_top = max(0, int(ix.max()) - width + 1), max(0, int(iy.max()) - height + 1)
+    if pad_left or pad_bottom or pad_right or pad_top:
+        padding = ((pad_bottom, pad_top), (pad_left, pad_right))
+        for key in ('sum', 'sumsq', 'weight', 'channel_weight'):
+            if key in accumulator:
+                accumulator[key] = np.pad(accumulator[key], padding)
+        if 'channel_sum' in accumulator:
+            accumulator['channel_sum'] = np.pad(accumulator['channel_sum'], ((0, 0),) + padding)
+        accumulator['ra0'] = accumulator['ra0'] - pad_left * accumulator['spacing']
+        accumulator['dec0'] = accumulator['dec0'] - pad_bottom * accumulator['spacing']
+    return ix + pad_left, iy + pad_bottom
+
+def merge_scan_into_field(accumulator_path, file_path):
+    """
+    Add one scan file to a field's running sums, creating the field file from the scan if needed.
+
+    Each cell keeps the sum, sum of squares and count of linear power, so merging costs only the
+    new scan's points and earlier passes never need to be reprocessed. Readings with a 'SPECTRUM'
+    are also summed per channel when the field was created with the same spectral axis.
+
+    Returns:
+    - accumulator: The updated field dictionary (already saved to accumulator_path).
+    """
+    points, header = load_scan_array(file_path)
+    if points.shape[0] == 0:
+        raise ValueError("Scan file contains no measurements")
+    if os.path.exists(accumulator_path):
+        accumulator = load_field_accumulator(accumulator_path)
+    else:
+        spacing = header.get('grid_spacing')
+        if not spacing:
+            raise ValueError("Scan file has no grid spacing to define the field grid")
+        accumulator = create_field_accumulator(points[0, 0], points[0, 1], spacing, header.get('spectrum_frequencies'))
+        print(f"Created field {accumulator_path} with {spacing:.4f} degree cells")
+
+    # Key on the data being merged, so touching or re-saving a scan does not merge it twice
+    merge_key = hashlib.sha256(np.ascontiguousarray(points).tobytes()).hexdigest()
+    if merge_key in accumulator['merged']:
+        print(f"{os.path.basename(file_path)} is already in this field, skipping")
+        return accumulator
+
+    spacing = float(accumulator['spacing'])
+    # Take RA offsets modulo 360 so passes over a field near RA 0 land in the same cells
+    ra_offsets = (points[:, 0] - accumulator['ra0'] + 180) % 360 - 180
+    ix = np.rint(ra_offsets / spacing).astype(int)
+    iy = np.rint((points[:, 1] - accumulator['dec0']) / spacing).astype(int)
+    ix, iy = grow_field_accumulator(accumulator, ix, iy)
+    linear = dB_to_linear(points[:, 2])
+    np.add.at(accumulator['sum'], (iy, ix), linear)
+    np.add.at(accumulator['sumsq'], (iy, ix), linear ** 2)
+    np.add.at(accumulator['weight'], (iy, ix), 1)
+
+    if 'channel_sum' in accumulator and header.get('spectrum_frequencies') is not None:
+        if np.allclose(header['spectrum_frequencies'], accumulator['spectrum_frequencies']):
+            with open(file_path, 'r') as file:
+                readings = json.load(file).get('measurements', [])
+            has_spectrum = np.array(['SPECTRUM' in reading for reading in readings])
+            spectra = np.array([reading['SPECTRUM'] for reading in readings if 'SPECTRUM' in reading]).reshape(-1, accumulator['channel_sum'].shape[0])
+            np.add.at(accumulator['channel_sum'], (slice(None), iy[has_spectrum], ix[has_spectrum]), spectra.T)
+            np.add.at(accumulator['channel_weight'], (iy[has_spectrum], ix[has_spectrum]), 1)
+        else:
+            print(f"Spectral axis of {os.path.basename(file_path)} differs from the field's, merging intensities only")
+
+    accumulator['merged'] = np.append(accumulator['merged'], merge_key)
+    save_field_accumulator(accumulator_path, accumulator)
+    print(f"Merged {points.shape[0]} points from {os.path.basename(file_path)} ({len(accumulator['merged'])} scans in field)")
+    return accumulator
+
+def get_field_maps(accumulator):
+    """
+    Returns:
+    - coadd_db: Co-added (mean linear power) map in dB, NaN where no data.
+    - noise_db: Standard error of each cell's mean expressed in dB, NaN where a cell has fewer than two samples.
+    - extent: [ra_min, ra_max, dec_min, dec_max] of the cell edges for imshow.
+    """
+    weight = accumulator['weight']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = accumulator['sum'] / weight
+        variance = (accumulator['sumsq'] - weight * mean ** 2) / (weight - 1)
+        standard_error = np.sqrt(np.clip(variance, 0, None) / weight)
+        coadd_db = np.where(weight > 0, linear_to_dB(mean), np.nan)
+        noise_db = np.where(weight > 1, linear_to_dB(1 + standard_error / mean), np.nan)
+    spacing = float(accumulator['spacing'])
+    height, width = weight.shape
+    ra0, dec0 = float(accumulator['ra0']), float(accumulator['dec0'])
+    extent = [ra0 - spacing / 2, ra0 + (width - 0.5) * spacing, dec0 - spacing / 2, dec0 + (height - 0.5) * spacing]
+    return coadd_db, noise_db, extent
+
+def show_field_maps(accumulator):
+    coadd_db, noise_db, extent = get_field_maps(accumulator)
+    fig, (ax_coadd, ax_noise) = plt.subplots(1, 2, figsize=(14, 6))
+    im = ax_coadd.imshow(coadd_db, cmap='viridis', interpolation='nearest', origin='lower', extent=extent)
+    fig.colorbar(im, ax=ax_coadd, label='Hydrogen Line Power (dB)')
+    ax_coadd.set_title(f"Co-added Map ({len(accumulator['merged'])} scans)")
+    im = ax_noise.imshow(noise_db, cmap='magma', interpolation='nearest', origin='lower', extent=extent)
+    fig.colorbar(im, ax=ax_noise, label='Standard Error (dB)')
+    ax_noise.set_title('Noise Map')
+    for ax in (ax_coadd, ax_noise):
+        ax.set_xlabel('Right Ascension')
+        ax.set_ylabel('Declination')
+    plt.show()
+
+# Velocity cube functions
+def load_scan_spectra(file_paths):
+    """
+    Collect the per-reading spectra of one or more scan files into arrays. All files must share
+    the same spectral axis ('spectrum_frequencies').
+
+    Returns:
+    - ra, dec, times: Arrays of length N (times as Unix seconds from each reading's local TIME).
+    - spectra: Array of shape (N, channels), linear power.
+    - freqs: Channel center frequencies in Hz.
+    - grid_spacing: Average grid spacing of the files.
+    """
+    ra, dec, times, spectra, spacings = [], [], [], [], []
+    freqs = None
+    for file_path in file_paths:
+        with open(file_path, 'r') as file:
+            data = json.load(file)
+        file_freqs = data.get('spectrum_frequencies')
+        if file_freqs is None:
+            raise ValueError(f"{os.path.basename(file_path)} has no spectra (scan with Spectrum Channels above 0, or reprocess raw IQ)")
+        file_freqs = np.asarray(file_freqs, dtype=np.float64)
+        if freqs is None:
+            freqs = file_freqs
+        elif freqs.shape != file_freqs.shape or not np.allclose(freqs, file_freqs):
+            raise ValueError(f"{os.path.basename(file_path)} has a different spectral axis from the other scans")
+        readings = [reading for reading in data.get('measurements', []) if 'SPECTRUM' in reading]
+        ra.extend(reading['RA'] for reading in readings)
+        dec.extend(reading['DEC'] for reading in readings)
+        times.extend(datetime.strptime(reading['TIME'][:19], "%Y-%m-%d_%H-%M-%S").timestamp() for reading in readings)
+        spectra.extend(reading['SPECTRUM'] for reading in readings)
+        if data.get('grid_spacing'):
+            spacings.append(data['grid_spacing'])
+    if not spectra:
+        raise ValueError("No spectra found in the selected scans")
+    return (np.array(ra), np.array(dec), np.array(times), np.array(spectra, dtype=np.float64), freqs,
+            sum(spacings) / len(spacings) if spacings else None)
+
+def compute_velocity_corrections(ra, dec, unix_times, frame="lsr"):
+    """
+    Velocity (km/s) to add to topocentric radial velocities to refer them to the given frame,
+    for arrays of RA/Dec (degrees) and Unix times, all computed at once.
+
+    Earth's orbital velocity comes from the low-precision solar longitude series (good to about
+    0.2 km/s). Earth's rotation (below 0.5 km/s) is not included because the site is unknown.
+    """
+    if frame == "topocentric":
+        return np.zeros(np.shape(ra))
+    days = np.asarray(unix_times) / 86400.0 + 2440587.5 - 2451545.0
+    mean_longitude = np.radians(280.460 + 0.9856474 * days)
+    mean_anomaly = np.radians(357.528 + 0.9856003 * days)
+    sun_longitude = mean_longitude + np.radians(1.915) * np.sin(mean_anomaly) + np.radians(0.020) * np.sin(2 * mean_anomaly)
+    perihelion = np.radians(EARTH_PERIHELION_LONGITUDE)
+    # Earth's heliocentric velocity in ecliptic coordinates, then rotated to equatorial
+    vx = EARTH_ORBITAL_SPEED * (np.sin(sun_longitude) - EARTH_ORBIT_ECCENTRICITY * np.sin(perihelion))
+    vy = -EARTH_ORBITAL_SPEED * (np.cos(sun_longitude) - EARTH_ORBIT_ECCENTRICITY * np.cos(perihelion))
+    obliquity = np.radians(OBLIQUITY)
+    earth_velocity = np.stack([vx, vy * np.cos(obliquity), vy * np.sin(obliquity)], axis=-1)
+
+    ra_rad, dec_rad = np.radians(ra), np.radians(dec)
+    direction = np.stack([np.cos(dec_rad) * np.cos(ra_rad), np.cos(dec_rad) * np.sin(ra_rad), np.sin(dec_rad)], axis=-1)
+    correction = np.sum(earth_velocity * direction, axis=-1)
+    if frame == "lsr":
+        apex_ra, apex_dec = np.radians(SOLAR_APEX_RA), np.radians(SOLAR_APEX_DEC)
+        apex = SOLAR_MOTION_SPEED * np.array([np.cos(apex_dec) * np.cos(apex_ra), np.cos(apex_dec) * np.sin(apex_ra), np.sin(apex_dec)])
+        correction = correction + direction @ apex
+    elif frame != "barycentric":
+        raise ValueError(f"Unknown velocity frame: {frame}")
+    return correction
+
+def frequency_to_velocity(freqs):
+    # Radio-convention radial velocity (km/s) of the HI line at each frequency
+    return SPEED_OF_LIGHT / 1000 * (HI_REST_FREQUENCY - np.asarray(freqs)) / HI_REST_FREQUENCY
+
+def regrid_spectra(spectra, channel_velocities, corrections, velocity_axis):
+    """
+    Shift every spectrum by its velocity correction and linearly interpolate all of them onto
+    velocity_axis in one vectorized step. Channels must be evenly spaced (as FFT channels are).
+
+    Returns an array of shape (N, len(velocity_axis)), NaN outside each spectrum's coverage.
+    """
+    channel_step = channel_velocities[1] - channel_velocities[0]
+    # Fractional channel index of every output velocity for every spectrum
+    position = (velocity_axis[None, :] - corrections[:, None] - channel_velocities[0]) / channel_step
+    lower = np.floor(position).astype(int)
+    fraction = position - lower
+    last = spectra.shape[1] - 1
+    valid = (position >= 0) & (position <= last)
+    lower = np.clip(lower, 0, last - 1)
+    below = np.take_along_axis(spectra, lower, axis=1)
+    above = np.take_along_axis(spectra, lower + 1, axis=1)
+    regridded = below + (above - below) * fraction
+    regridded[~valid] = np.nan
+    return regridded
+
+def build_velocity_cube(file_paths, v_min, v_max, dv, frame="lsr", baseline_fraction=0.15):
+    """
+    Build an RA/Dec/velocity cube and its moment maps from scans with per-reading spectra.
+
+    Spectra are Doppler corrected to the chosen frame, regridded onto a common velocity axis,
+    baseline subtracted (median of the outer baseline_fraction of each spectrum's own channels
+    at each end, so it does not depend on the output velocity range) and averaged into RA/Dec
+    cells of the scans' grid spacing.
+
+    Returns:
+    - Dictionary with 'cube' (velocity, dec, ra), 'velocity', 'extent', 'moment0' and 'moment1'.
+    """
+    ra, dec, times, spectra, freqs, spacing = load_scan_spectra(file_paths)
+    if spacing is None:
+        raise ValueError("Scans have no grid spacing to grid the cube on")
+    channel_velocities = frequency_to_velocity(freqs)
+    velocity_axis = np.arange(v_min, v_max + dv / 2, dv)
+    coverage = (channel_velocities.min(), channel_velocities.max())
+    print(f"Spectra cover {coverage[0]:.1f} to {coverage[1]:.1f} km/s (topocentric); building {len(velocity_axis)} channels, frame {frame}")
+    corrections = compute_velocity_corrections(ra, dec, times, frame)
+    regridded = regrid_spectra(spectra, channel_velocities, corrections, velocity_axis)
+
+    # The baseline is a constant offset, so it can be taken from the measured channels before regridding
+    edge = max(1, int(spectra.shape[1] * baseline_fraction))
+    baseline = np.median(np.concatenate([spectra[:, :edge], spectra[:, -edge:]], axis=1), axis=1)
+    regridded -= baseline[:, None]
+
+    # Measure RA from the first point modulo 360 so a scan across RA 0 stays one compact grid
+    ra_offsets = (ra - ra[0] + 180) % 360 - 180
+    ra_start = ra[0] + ra_offsets.min()
+    ix = np.rint((ra_offsets - ra_offsets.min()) / spacing).astype(int)
+    iy = np.rint((dec - dec.min()) / spacing).astype(int)
+    width, height = ix.max() + 1, iy.max() + 1
+    sums = np.zeros((len(velocity_axis), height, width))
+    counts = np.zeros((len(velocity_axis), height, width))
+    valid = ~np.isnan(regridded)
+    np.add.at(sums, (slice(None), iy, ix), np.where(valid, regridded, 0).T)
+    np.add.at(counts, (slice(None), iy, ix), valid.T)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cube = sums / counts
+        moment0 = np.nansum(cube, axis=0) * dv
+        positive = np.where(cube > 0, cube, 0)
+        moment1 = np.nansum(positive * velocity_axis[:, None, None], axis=0) / np.nansum(positive, axis=0)
+    observed = counts.sum(axis=0) > 0
+    moment0[~observed] = np.nan
+    moment1[~observed] = np.nan
+    extent = [ra_start - spacing / 2, ra_start + (width - 0.5) * spacing, dec.min() - spacing / 2, dec.min() + (height - 0.5) * spacing]
+    return {'cube': cube, 'velocity': velocity_axis, 'extent': np.array(extent), 'moment0': moment0, 'moment1': moment1,
+            'frame': np.array(frame)}
+
+def show_moment_maps(cube):
+    fig, (ax_moment0, ax_moment1) = plt.subplots(1, 2, figsize=(14, 6))
+    extent = list(cube['extent'])
+    im = ax_moment0.imshow(cube['moment0'], cmap='viridis', interpolation='nearest', origin='lower', extent=extent)
+    fig.colorbar(im, ax=ax_moment0, label='Integrated Intensity (power x km/s)')
+    ax_moment0.set_title('Moment 0: Integrated Intensity')
+    im = ax_moment1.imshow(cube['moment1'], cmap='coolwarm', interpolation='nearest', origin='lower', extent=extent)
+    fig.colorbar(im, ax=ax_moment1, label=f"Mean Velocity ({str(cube['frame']).upper()}, km/s)")
+    ax_moment1.set_title('Moment 1: Mean Velocity')
+    for ax in (ax_moment0, ax_moment1):
+        ax.set_xlabel('Right Ascension')
+        ax.set_ylabel('Declination')
+    plt.show()
+
+# Raw IQ reprocessing functions
+def init_reprocess_worker(backend):
+    # Each worker process already has a core to itself, so its FFTs run single-threaded. The
+    # parent has planned that size, so the plan comes from the saved wisdom without measuring.
+    global fft_threads
+    fft_threads = 1
+    select_fft_backend(backend)
+
+def reprocess_point(task):
+    """
+    Recompute one point of a raw IQ recording. Runs in a worker process, so it takes a single
+    picklable tuple and opens its memory-mapped file read-only.
+
+    Returns:
+    - (intensity_db, spectrum): Averaged band power in dB and the averaged, binned linear power spectrum.
+    """
+    file_path, num_bytes, sample_rate, center_freq, num_samples, freq_range, window, rfi_threshold, spectrum_channels = task
+    raw = np.memmap(file_path, dtype=np.uint8, mode='r', shape=(num_bytes,))
+    chunk_bytes = num_samples * 2
+    power_values = []
+    spectrum_sum = np.zeros(spectrum_channels)
+    for start in range(0, num_bytes - chunk_bytes + 1, chunk_bytes):
+        samples = bytes_to_iq(np.asarray(raw[start:start + chunk_bytes]))
+        freqs, power_spectrum = compute_power_spectrum(samples, sample_rate, center_freq, window)
+        power_spectrum = apply_rfi_filter(power_spectrum, rfi_threshold)
+        power_values.append(integrate_band(freqs, power_spectrum, center_freq, freq_range))
+        spectrum_sum += bin_spectrum(freqs, power_spectrum, spectrum_channels)[1]
+    if not power_values:
+        raise ValueError(f"Raw file {file_path} holds less than one measurement")
+    intensity_db = 10 * np.log10(np.mean(power_values) + 1e-10)
+    return float(intensity_db), (spectrum_sum / len(power_values)).tolist()
+
+def reprocess_raw_recording(raw_folder, freq_range, window="none", rfi_threshold=None, spectrum_channels=256, workers=None):
+    """
+    Recompute intensities and spectra from a raw IQ recording, spreading points across CPU cores.
+
+    The result is written next to the recording folder as a regular scan file (with an added
+    'SPECTRUM' per reading and a shared 'spectrum_frequencies' axis) so that it can be imaged
+    and catalogued like any other scan.
+
+    Returns:
+    - file_path: Path of the written scan file.
+    """
+    global fft_threads
+    with open(os.path.join(raw_folder, RAW_INDEX_FILENAME), 'r') as file:
+        index = json.load(file)
+    header = index['scan']
+    sample_rate = header['sample_rate']
+    center_freq = header['center_frequency']
+    num_samples = header['num_samples']
+    tasks = [(os.path.join(raw_folder, point['file']), point['NUM_BYTES'], sample_rate, center_freq, num_samples,
+              freq_range, window, rfi_threshold, spectrum_channels) for point in index['points']]
+    if not tasks:
+        raise ValueError("Raw recording contains no points")
+    print(f"Reprocessing {len(tasks)} points from {raw_folder} (window: {window}, RFI threshold: {rfi_threshold})")
+
+    # Plan the single-threaded FFT once here and save it as wisdom for the worker processes
+    threads = fft_threads
+    fft_threads = 1
+    try:
+        prepare_fft(num_samples)
+    finally:
+        fft_threads = threads
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_reprocess_worker, initargs=(fft_backend,)) as executor:
+        results = list(executor.map(reprocess_point, tasks))
+
+    # Every point shares the same channel layout, so the frequency axis only needs computing once
+    freqs = np.fft.fftshift(np.fft.fftfreq(num_samples, 1 / sample_rate)) + center_freq
+    spectrum_freqs = bin_spectrum(freqs, np.zeros(num_samples), spectrum_channels)[0]
+    data = {key: value for key, value in header.items() if key not in ('num_samples', 'start_time', 'fft_backend')}
+    data.update({
+        'bandwidth': freq_range,
+        'window': window,
+        'rfi_threshold': rfi_threshold,
+        'reprocessed_from': os.path.basename(os.path.normpath(raw_folder)),
+        'spectrum_frequencies': spectrum_freqs.tolist(),
+        'measurements': [{
+            'RA': point['RA'],
+            'DEC': point['DEC'],
+            'INTENSITY': intensity_db,
+            'TIME': point['START_TIME'][:19],
+            'SPECTRUM': spectrum
+        } for point, (intensity_db, spectrum) in zip(index['points'], results)]
+    })
+    output_folder = os.path.dirname(os.path.normpath(raw_folder))
+    file_path = save_measurement(data, output_folder, f"{header['start_time']}_reprocessed.json")
+    print(f"Reprocessed scan saved to {file_path}")
+    return file_path
+
 # Calculator functions
 def calculate_grid_spacing(wavelength, diameter, overlap):
     try:
@@ -475,6 +2282,236 @@ def calculate_grid_spacing(wavelength, diameter, overlap):
     except Exception as e:
         raise ValueError(f"Error calculating grid spacing: {str(e)}")
 
+# Simulated hardware for dry runs of the scan schedule
+class SimulatedClock:
+    """
+    Clock for dry runs. It runs in real time, so the program's own bookkeeping and saving are
+    counted as they would be during a scan, and jumps forward for simulated waits and for work
+    that is charged from a measured cost instead of being done.
+    """
+    def __init__(self):
+        self.offset = 0.0
+
+    def time(self):
+        return time.perf_counter() + self.offset
+
+    def advance(self, seconds):
+        self.offset += seconds
+
+class SimulatedTelescope:
+    """
+    Minimal stand-in for an ASCOM telescope. Slews move both axes at once at slew_rate (deg/s),
+    plus a fixed overhead per slew for acceleration and braking, measured on a SimulatedClock.
+    """
+    def __init__(self, clock, ra, dec, slew_rate, slew_overhead):
+        self.clock = clock
+        self.Connected = True
+        self.RightAscension = ra / 15
+        self.Declination = dec
+        self.TargetRightAscension = self.RightAscension
+        self.TargetDeclination = dec
+        self.slew_rate = slew_rate
+        self.slew_overhead = slew_overhead
+        self.slew_end = 0.0
+
+    def SlewToTarget(self):
+        distance = max(abs(self.TargetRightAscension - self.RightAscension) * 15, abs(self.TargetDeclination - self.Declination))
+        self.slew_end = self.clock.time() + (self.slew_overhead + distance / self.slew_rate if distance > 0 else 0.0)
+        self.RightAscension = self.TargetRightAscension
+        self.Declination = self.TargetDeclination
+
+    @property
+    def Slewing(self):
+        return self.clock.time() < self.slew_end
+
+class SimulatedSdr:
+    """
+    Stand-in for the RtlSdr object. The spectral processing of one block of noise is timed once;
+    measure() then charges each read its capture time plus that cost instead of doing the work.
+    """
+    def __init__(self, clock, sample_rate, center_freq, freq_range, spectrum_channels=0, num_samples=SAMPLES_PER_MEASUREMENT):
+        self.clock = clock
+        self.sample_rate = sample_rate
+        self.center_freq = center_freq
+        rng = np.random.default_rng(0)
+        samples = (rng.standard_normal(num_samples) + 1j * rng.standard_normal(num_samples)) / 4
+        prepare_fft(num_samples)
+        costs = []
+        for _ in range(3):
+            start = time.perf_counter()
+            freqs, power_spectrum = compute_power_spectrum(samples, sample_rate, center_freq)
+            self.power_db = 10 * np.log10(integrate_band(freqs, power_spectrum, center_freq, freq_range) + 1e-10)
+            self.spectrum = bin_spectrum(freqs, power_spectrum, spectrum_channels) if spectrum_channels else (None, None)
+            costs.append(time.perf_counter() - start)
+        self.processing_time = min(costs)
+
+    def measure(self, readings_per_measurement, num_samples=SAMPLES_PER_MEASUREMENT, freq_range=10000, timer=None,
+                raw_recorder=None, spectrum_channels=None):
+        # Same arguments and return values as measure_point
+        time_per_read = num_samples / self.sample_rate
+        num_reads = max(1, int(readings_per_measurement / time_per_read))
+        phase = timer.phase if timer is not None else (lambda name: contextlib.nullcontext())
+        with phase("capture"):
+            self.clock.advance(num_reads * time_per_read)
+        with phase("fft"):
+            self.clock.advance(num_reads * self.processing_time)
+        return self.power_db, self.spectrum[0], self.spectrum[1]
+
+    def close(self):
+        pass
+
+class SimulatedRoot:
+    # Runs root.after callbacks in time order on a SimulatedClock instead of the Tk event loop
+    def __init__(self, clock):
+        self.clock = clock
+        self.events = []
+
+    def after(self, ms, func, *args):
+        self.events.append((self.clock.time() + ms / 1000, len(self.events), func, args))
+
+    def update_idletasks(self):
+        pass
+
+    def run(self):
+        while self.events:
+            event = min(self.events)
+            self.events.remove(event)
+            due, _, func, args = event
+            if due > self.clock.time():
+                self.clock.advance(due - self.clock.time())
+            func(*args)
+
+class SimulatedWidget:
+    def __init__(self):
+        self.text = ""
+
+    def config(self, **kwargs):
+        self.text = kwargs.get('text', self.text)
+
+    def winfo_children(self):
+        return []
+
+class SimulatedCanvas:
+    # Stand-in for the live plot canvas: each redraw costs as long as one measured draw of fig
+    def __init__(self, clock, fig):
+        self.clock = clock
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()  # The first draw sets up fonts and caches, which later redraws reuse
+        start = time.perf_counter()
+        canvas.draw()
+        self.draw_time = time.perf_counter() - start
+
+    def draw(self):
+        self.clock.advance(self.draw_time)
+
+def simulate_scan(points, initial_ra, initial_dec, settings, slew_rate, slew_overhead, folder):
+    """
+    Dry-run run_grid_scan over points against a simulated telescope and SDR, saving into folder.
+
+    settings holds the scan_settings() entries to change for the dry run (grid_width,
+    readings_per_measurement, spectrum_channels, ...); the Data Collection settings are not touched.
+
+    Returns:
+    - total: Seconds from the start of the scan until the telescope is back at the initial position.
+    - file_path: The scan file written by the dry run (its timing_summary has the per-phase times).
+    """
+    clock = SimulatedClock()
+    root = SimulatedRoot(clock)
+    status_label = SimulatedWidget()
+    telescope = SimulatedTelescope(clock, initial_ra, initial_dec, slew_rate, slew_overhead)
+    dry_run_settings = dict(scan_settings(), **settings)
+    dry_run_settings.update(output_folder=folder, record_raw_iq=False, capture_out_of_process=False)
+    fig = None
+    try:
+        sdr = SimulatedSdr(clock, dry_run_settings['sdr_sample_rate'], dry_run_settings['sdr_center_freq'],
+                           dry_run_settings['sdr_bandwidth'], dry_run_settings['spectrum_channels'])
+        fig, ax, im, grid = initialize_plot(dry_run_settings['grid_width'], dry_run_settings['grid_height'], points,
+                                            dry_run_settings['grid_spacing'])
+        canvas = SimulatedCanvas(clock, fig)
+        start = clock.time()
+        # The scan prints several lines per point; keep the dry run out of the log window
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_grid_scan(root, status_label, SimulatedWidget(), SimulatedWidget(), canvas, fig, ax, im, grid, list(points),
+                          telescope=telescope, sdr=sdr, clock=clock.time, measure=lambda sdr, *args, **kwargs: sdr.measure(*args, **kwargs),
+                          settings=dry_run_settings)
+            root.run()
+            # The slew back to the initial position is not waited for by the scan itself
+            if telescope.Slewing:
+                clock.advance(telescope.slew_end - clock.time())
+        total = clock.time() - start
+    finally:
+        if fig is not None:
+            plt.close(fig)
+    scan_files = glob.glob(os.path.join(folder, "*.json"))
+    if not scan_files:
+        raise ValueError(f"Dry run of the scan failed: {status_label.text}")
+    return total, scan_files[0]
+
+def estimate_raw_size(num_points, averaging_time, sample_rate, num_samples=SAMPLES_PER_MEASUREMENT):
+    # Raw IQ is not written during the dry run; it is 2 bytes per sample read
+    num_measurements = max(1, int(averaging_time / (num_samples / sample_rate)))
+    return num_points * num_measurements * num_samples * 2
+
+def folder_size(folder):
+    return sum(os.path.getsize(os.path.join(path, name)) for path, _, names in os.walk(folder) for name in names)
+
+def plan_survey(region_width, region_height, diameter, overlap, averaging_time, settle, slew_rate, slew_overhead,
+                sample_rate, spectrum_channels=0, record_raw=False):
+    """
+    Plan a grid scan covering region_width x region_height degrees at the beam-limited spacing for
+    the dish, and predict its duration and disk usage with a dry run of the scan.
+    """
+    spacing = calculate_grid_spacing(HI_WAVELENGTH, diameter, overlap)
+    if spacing <= 0:
+        raise ValueError("Overlap must be below 100% to give a positive grid spacing")
+    width = max(1, math.ceil(region_width / spacing))
+    height = max(1, math.ceil(region_height / spacing))
+    # Duration does not depend on where the region is, so plan around RA/Dec 180/0
+    points = iterative_spiral(180.0, 0.0, width, height, spacing)
+    settings = {
+        'grid_width': width,
+        'grid_height': height,
+        'grid_spacing': spacing,
+        'readings_per_measurement': averaging_time,
+        'settle_time': settle,
+        'sdr_sample_rate': sample_rate,
+        'sdr_center_freq': HI_REST_FREQUENCY,
+        'spectrum_channels': spectrum_channels
+    }
+    folder = tempfile.mkdtemp(prefix="h1ime_plan_")
+    try:
+        total, file_path = simulate_scan(points, 180.0, 0.0, settings, slew_rate, slew_overhead, folder)
+        with open(file_path, 'r') as file:
+            timing_summary = json.load(file)['timing_summary']
+        json_bytes = os.path.getsize(file_path)
+        cache_bytes = folder_size(folder) - json_bytes
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    timings = {phase: seconds for phase, seconds in timing_summary['totals'].items() if seconds > 0}
+    timings['other'] = timing_summary['untracked']
+    timings['return'] = max(0.0, total - timing_summary['elapsed'])  # Slew back to the start
+    raw_bytes = estimate_raw_size(len(points), averaging_time, sample_rate) if record_raw else 0
+    return {
+        'grid_spacing': spacing,
+        'grid_width': width,
+        'grid_height': height,
+        'num_points': len(points),
+        'timings': timings,
+        'duration': total,
+        'disk': {'json': json_bytes, 'cache': cache_bytes, 'raw': raw_bytes, 'total': json_bytes + cache_bytes + raw_bytes}
+    }
+
+def format_size(num_bytes):
+    for unit in ("B", "KB", "MB", "GB"):
+        if num_bytes < 1024 or unit == "GB":
+            return f"{num_bytes:.1f} {unit}" if unit != "B" else f"{num_bytes} B"
+        num_bytes /= 1024
+
+def format_duration(seconds):
+    hours, remainder = divmod(int(round(seconds)), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}h {minutes:02d}m {seconds:02d}s"
+
 # GUI functions
 def select_output_folder(folder_label):
     global output_folder
@@ -540,6 +2577,19 @@ def create_data_collection_frame(parent, root, log_text):
     settle_time_entry = ttk.Entry(grid_frame, width=15)
     settle_time_entry.insert(0, "2")
     settle_time_entry.grid(row=4, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(grid_frame, text="Scan Mode:").grid(row=5, column=0, sticky=tk.W, padx=5, pady=2)
+    scan_mode_combobox = ttk.Combobox(grid_frame, values=SCAN_MODES, width=25, state="readonly")
+    scan_mode_combobox.set(SCAN_MODES[0])
+    scan_mode_combobox.grid(row=5, column=1, columnspan=2, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(grid_frame, text="Coarse Step (grid cells):").grid(row=6, column=0, sticky=tk.W, padx=5, pady=2)
+    coarse_step_entry = ttk.Entry(grid_frame, width=15)
+    coarse_step_entry.insert(0, "4")
+    coarse_step_entry.grid(row=6, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(grid_frame, text="Refine Threshold (dB):").grid(row=7, column=0, sticky=tk.W, padx=5, pady=2)
+    refine_threshold_entry = ttk.Entry(grid_frame, width=15)
+    refine_threshold_entry.insert(0, "0.5")
+    refine_threshold_entry.grid(row=7, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(grid_frame, text="(Adaptive mode only; Grid Spacing is the finest spacing)").grid(row=7, column=2, sticky=tk.W, padx=5, pady=2)
 
     # SDR Settings
     sdr_frame = ttk.LabelFrame(frame, text="SDR Settings", padding="5")
@@ -560,6 +2610,19 @@ def create_data_collection_frame(parent, root, log_text):
     bandwidth_entry = ttk.Entry(sdr_frame, width=15)
     bandwidth_entry.insert(0, "10000")
     bandwidth_entry.grid(row=3, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(sdr_frame, text="FFT Backend:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=2)
+    fft_combobox = ttk.Combobox(sdr_frame, values=FFT_BACKENDS, width=12, state="readonly")
+    fft_combobox.set("auto")
+    fft_combobox.grid(row=4, column=1, sticky=tk.W, padx=5, pady=2)
+    fft_label = ttk.Label(sdr_frame, text="")
+    fft_label.grid(row=5, column=0, columnspan=3, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(sdr_frame, text="Spectrum Channels:").grid(row=6, column=0, sticky=tk.W, padx=5, pady=2)
+    spectrum_channels_entry = ttk.Entry(sdr_frame, width=15)
+    spectrum_channels_entry.insert(0, "0")
+    spectrum_channels_entry.grid(row=6, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(sdr_frame, text="(0 = don't save spectra; needed for velocity cubes)").grid(row=6, column=2, sticky=tk.W, padx=5, pady=2)
+    capture_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(sdr_frame, text="Capture in separate process (for high sample rates)", variable=capture_var).grid(row=7, column=0, columnspan=3, sticky=tk.W, padx=5, pady=2)
 
     # Output Settings
     output_frame = ttk.LabelFrame(frame, text="Output Settings", padding="5")
@@ -568,6 +2631,9 @@ def create_data_collection_frame(parent, root, log_text):
     folder_button.grid(row=0, column=0, columnspan=2, pady=5)
     folder_label = ttk.Label(output_frame, text="Output Folder: Not Selected")
     folder_label.grid(row=1, column=0, columnspan=2, pady=5)
+    raw_iq_var = tk.BooleanVar(value=False)
+    raw_iq_check = ttk.Checkbutton(output_frame, text="Record raw IQ (for reprocessing later)", variable=raw_iq_var)
+    raw_iq_check.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=2)
 
     # Plot Frame (always visible in Data Collection mode)
     plot_frame = ttk.LabelFrame(frame, text="Live Scan Visualization", padding="5")
@@ -581,9 +2647,21 @@ def create_data_collection_frame(parent, root, log_text):
     start_button.grid(row=0, column=0, padx=5)
     status_label = ttk.Label(control_frame, text="Idle")
     status_label.grid(row=0, column=1, padx=5)
+    efficiency_label = ttk.Label(control_frame, text="Efficiency: -")
+    efficiency_label.grid(row=1, column=0, columnspan=2, sticky=tk.W, padx=5)
+
+    # Scan Quality Control
+    qc_frame = ttk.LabelFrame(frame, text="Scan Quality Control", padding="5")
+    qc_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+    qc_control = {'abort': False, 'remeasure': False, 'summary': None}
+    qc_label = ttk.Label(qc_frame, text="Scan not started", justify=tk.LEFT)
+    qc_label.grid(row=0, column=0, columnspan=3, sticky=tk.W, padx=5, pady=2)
+    ttk.Button(qc_frame, text="Abort Scan", command=lambda: qc_control.update(abort=True)).grid(row=1, column=0, padx=5, pady=5)
+    ttk.Button(qc_frame, text="Re-measure Flagged Points", command=lambda: qc_control.update(remeasure=True)).grid(row=1, column=1, padx=5, pady=5)
+    ttk.Button(qc_frame, text="Show Histogram", command=lambda: show_qc_histogram(qc_control['summary'])).grid(row=1, column=2, padx=5, pady=5)
 
     def start_scan(root, status_label, start_button, width_entry, height_entry, spacing_entry, avg_time_entry, center_freq_entry, sample_rate_entry, gain_entry, settle_time_entry, driver_combobox, plot_frame, bandwidth_entry):
-        global grid_width, grid_height, grid_spacing, readings_per_measurement, sdr_center_freq, sdr_sample_rate, sdr_gain, settle_time, telescope_progid, sdr_bandwidth
+        global grid_width, grid_height, grid_spacing, readings_per_measurement, sdr_center_freq, sdr_sample_rate, sdr_gain, settle_time, telescope_progid, sdr_bandwidth, record_raw_iq, spectrum_channels, capture_out_of_process
         try:
             grid_width = int(width_entry.get())
             grid_height = int(height_entry.get())
@@ -595,6 +2673,20 @@ def create_data_collection_frame(parent, root, log_text):
             settle_time = float(settle_time_entry.get())
             sdr_bandwidth = float(bandwidth_entry.get())
             telescope_progid = driver_combobox.get()
+            record_raw_iq = raw_iq_var.get()
+            capture_out_of_process = capture_var.get()
+            spectrum_channels = int(spectrum_channels_entry.get())
+            if spectrum_channels < 0:
+                raise ValueError("Spectrum channels cannot be negative")
+            adaptive = scan_mode_combobox.get() == SCAN_MODES[1]
+            if adaptive:
+                # The adaptive settings are only read (and checked) when they are used
+                coarse_step = int(coarse_step_entry.get())
+                refine_threshold = float(refine_threshold_entry.get())
+                if coarse_step < 1:
+                    raise ValueError("Coarse step must be at least 1")
+                if refine_threshold < 0:
+                    raise ValueError("Refine threshold cannot be negative")
             if not telescope_progid:
                 raise ValueError("No telescope driver selected")
             if not output_folder:
@@ -614,6 +2706,8 @@ def create_data_collection_frame(parent, root, log_text):
             status_label.config(text="Error: Invalid input values")
             messagebox.showerror("Error", error_msg)
             return
+        select_fft_backend(fft_combobox.get())
+        fft_label.config(text=f"Active FFT backend: {describe_fft_backend()}")
         start_button.config(state="disabled")
         status_label.config(text="Starting scan...")
         root.update_idletasks()
@@ -625,11 +2719,129 @@ def create_data_collection_frame(parent, root, log_text):
         initial_ra, initial_dec = get_current_position(telescope)
         points = iterative_spiral(initial_ra, initial_dec, grid_width, grid_height, grid_spacing)
         fig, ax, im, grid = initialize_plot(grid_width, grid_height, points)
+        refiner = None
+        if adaptive:
+            refiner = AdaptiveRefiner(points, grid_spacing, coarse_step, refine_threshold)
+            points = refiner.initial_points((initial_ra, initial_dec))
+            print(f"Adaptive scan: {len(points)} coarse points of up to {grid_width*grid_height}")
         canvas_widget = FigureCanvasTkAgg(fig, master=plot_frame)
         canvas_widget.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
         root.update_idletasks()
         
-        run_grid_scan(root, status_label, start_button, plot_frame, canvas_widget, fig, ax, im, grid, points)
+        efficiency_label.config(text="Efficiency: -")
+        qc_control.update(abort=False, remeasure=False, summary=None)
+        qc_label.config(text="No points measured yet")
+        run_grid_scan(root, status_label, start_button, plot_frame, canvas_widget, fig, ax, im, grid, points, efficiency_label, refiner, qc_label, qc_control)
+
+    return frame
+
+def create_time_series_frame(parent, root, log_text):
+    frame = ttk.LabelFrame(parent, text="Time Series", padding="5")
+    frame.columnconfigure(0, weight=1)
+    frame.columnconfigure(1, weight=1)
+
+    # Pointing Settings
+    pointing_frame = ttk.LabelFrame(frame, text="Pointing Settings", padding="5")
+    pointing_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=5)
+    ttk.Label(pointing_frame, text="Telescope Driver:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
+    driver_combobox = ttk.Combobox(pointing_frame, values=TELESCOPE_DRIVERS, width=30)
+    driver_combobox.set("EQMOD.Telescope")
+    driver_combobox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(pointing_frame, text="Mode:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
+    mode_combobox = ttk.Combobox(pointing_frame, values=TIME_SERIES_MODES, width=30, state="readonly")
+    mode_combobox.set(TIME_SERIES_MODES[0])
+    mode_combobox.grid(row=1, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(pointing_frame, text="Right Ascension (degrees):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
+    ra_entry = ttk.Entry(pointing_frame, width=15)
+    ra_entry.grid(row=2, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(pointing_frame, text="Declination (degrees):").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
+    dec_entry = ttk.Entry(pointing_frame, width=15)
+    dec_entry.grid(row=3, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(pointing_frame, text="(Leave RA/Dec empty to use the current position)").grid(row=4, column=0, columnspan=2, sticky=tk.W, padx=5, pady=2)
+
+    # Recording Settings
+    recording_frame = ttk.LabelFrame(frame, text="Recording Settings", padding="5")
+    recording_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=5)
+    entries = {}
+    for index, (key, label, default) in enumerate([
+            ("duration_hours", "Duration (hours):", "6"),
+            ("integration_time", "Integration Time (s):", "1"),
+            ("settle_time", "Settle Time (s):", "2"),
+            ("center_freq", "Center Frequency (Hz):", "1420000000"),
+            ("sample_rate", "Sample Rate (Hz):", "250000"),
+            ("gain", "Gain:", "40"),
+            ("bandwidth", "Bandwidth (Hz):", "10000"),
+            ("channels", "Spectrum Channels:", "256")]):
+        ttk.Label(recording_frame, text=label).grid(row=index, column=0, sticky=tk.W, padx=5, pady=2)
+        entries[key] = ttk.Entry(recording_frame, width=15)
+        entries[key].insert(0, default)
+        entries[key].grid(row=index, column=1, sticky=tk.W, padx=5, pady=2)
+    capture_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(recording_frame, text="Capture in separate process (for high sample rates)", variable=capture_var).grid(row=8, column=0, columnspan=2, sticky=tk.W, padx=5, pady=2)
+    time_series_folder = {'path': ""}
+    folder_button = ttk.Button(recording_frame, text="Select Output Folder", command=lambda: select_time_series_folder())
+    folder_button.grid(row=9, column=0, pady=5)
+    folder_label = ttk.Label(recording_frame, text="Output Folder: Not Selected")
+    folder_label.grid(row=9, column=1, pady=5)
+
+    # Strip chart (always visible in Time Series mode)
+    plot_frame = ttk.LabelFrame(frame, text="Live Strip Chart", padding="5")
+    plot_frame.grid(row=0, column=1, rowspan=2, sticky=(tk.N, tk.S, tk.E, tk.W), padx=5, pady=5)
+    ttk.Label(plot_frame, text="Recording not started").pack(pady=10)
+
+    # Control and Status
+    control_frame = ttk.Frame(frame)
+    control_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=10)
+    start_button = ttk.Button(control_frame, text="Start Recording", command=lambda: start_time_series())
+    start_button.grid(row=0, column=0, padx=5)
+    stop_button = ttk.Button(control_frame, text="Stop", state="disabled", command=lambda: control.update(stop=True))
+    stop_button.grid(row=0, column=1, padx=5)
+    status_label = ttk.Label(control_frame, text="Idle")
+    status_label.grid(row=0, column=2, padx=5)
+    control = {'stop': False}
+
+    def select_time_series_folder():
+        time_series_folder['path'] = filedialog.askdirectory()
+        folder_label.config(text=f"Output Folder: {time_series_folder['path'] if time_series_folder['path'] else 'Not Selected'}")
+
+    def start_time_series():
+        try:
+            settings = {key: float(entry.get()) for key, entry in entries.items()}
+            settings['channels'] = int(settings['channels'])
+            ra_str, dec_str = ra_entry.get().strip(), dec_entry.get().strip()
+            if ra_str or dec_str:
+                settings['ra'], settings['dec'] = validate_coordinates(ra_str, dec_str)
+            else:
+                settings['ra'] = settings['dec'] = None
+            settings['progid'] = driver_combobox.get()
+            settings['mode'] = mode_combobox.get()
+            settings['output_folder'] = time_series_folder['path']
+            settings['out_of_process'] = capture_var.get()
+            if not settings['progid']:
+                raise ValueError("No telescope driver selected")
+            if not settings['output_folder']:
+                raise ValueError("Output folder not selected")
+            for key in ("duration_hours", "integration_time", "bandwidth", "channels"):
+                if settings[key] <= 0:
+                    raise ValueError(f"{key.replace('_', ' ').capitalize()} must be positive")
+        except ValueError as e:
+            error_msg = f"Invalid input values: {str(e)}"
+            print(error_msg)
+            log_error(error_msg)
+            status_label.config(text="Error: Invalid input values")
+            messagebox.showerror("Error", error_msg)
+            return
+        control['stop'] = False
+        start_button.config(state="disabled")
+        stop_button.config(state="normal")
+        status_label.config(text="Starting time series...")
+        for widget in plot_frame.winfo_children():
+            widget.destroy()
+        fig, ax, line = initialize_strip_chart()
+        canvas_widget = FigureCanvasTkAgg(fig, master=plot_frame)
+        canvas_widget.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        root.update_idletasks()
+        run_time_series(root, status_label, start_button, stop_button, plot_frame, canvas_widget, ax, line, settings, control)
 
     return frame
 
@@ -647,7 +2859,8 @@ def create_image_assembly_frame(parent, root, log_text):
                 status_label.config(text="Processing file...")
                 root.update_idletasks()
                 data_points, grid_spacing = read_data_from_file(file_path)
-                generate_image(data_points, grid_spacing)
+                _, header = load_scan_array(file_path)
+                generate_image(data_points, grid_spacing, fill_gaps=header.get('scan_mode') == 'adaptive')
                 status_label.config(text="Image generated successfully")
             except ValueError as e:
                 error_msg = f"Error processing file: {str(e)}"
@@ -658,6 +2871,220 @@ def create_image_assembly_frame(parent, root, log_text):
         else:
             status_label.config(text="No file selected")
 
+    # Scan Catalog
+    catalog_frame = ttk.LabelFrame(frame, text="Scan Catalog", padding="5")
+    catalog_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
+    catalog_folder = {'path': ""}
+    catalog_folder_button = ttk.Button(catalog_frame, text="Select Scan Folder", command=lambda: select_catalog_folder())
+    catalog_folder_button.grid(row=0, column=0, columnspan=2, pady=5)
+    catalog_folder_label = ttk.Label(catalog_frame, text="Scan Folder: Not Selected")
+    catalog_folder_label.grid(row=0, column=2, columnspan=2, pady=5)
+    query_entries = {}
+    for index, (key, label) in enumerate([("ra_min", "RA Min (deg):"), ("ra_max", "RA Max (deg):"),
+                                          ("dec_min", "Dec Min (deg):"), ("dec_max", "Dec Max (deg):")]):
+        ttk.Label(catalog_frame, text=label).grid(row=1 + index // 2, column=(index % 2) * 2, sticky=tk.W, padx=5, pady=2)
+        query_entries[key] = ttk.Entry(catalog_frame, width=10)
+        query_entries[key].grid(row=1 + index // 2, column=(index % 2) * 2 + 1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(catalog_frame, text="Since (YYYY-MM-DD):").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
+    since_entry = ttk.Entry(catalog_frame, width=12)
+    since_entry.grid(row=3, column=1, sticky=tk.W, padx=5, pady=2)
+    index_button = ttk.Button(catalog_frame, text="Index Folder", command=lambda: index_folder())
+    index_button.grid(row=4, column=0, columnspan=2, pady=5)
+    query_button = ttk.Button(catalog_frame, text="Query and Generate Image", command=lambda: query_and_generate())
+    query_button.grid(row=4, column=2, columnspan=2, pady=5)
+
+    def select_catalog_folder():
+        catalog_folder['path'] = filedialog.askdirectory()
+        catalog_folder_label.config(text=f"Scan Folder: {catalog_folder['path'] if catalog_folder['path'] else 'Not Selected'}")
+
+    def index_folder():
+        try:
+            if not catalog_folder['path']:
+                raise ValueError("Scan folder not selected")
+            status_label.config(text="Indexing scans...")
+            root.update_idletasks()
+            indexed, removed = update_catalog(catalog_folder['path'])
+            status_label.config(text=f"Catalog updated: {indexed} indexed, {removed} removed")
+        except Exception as e:
+            error_msg = f"Error indexing scan folder: {str(e)}"
+            print(error_msg)
+            log_error(error_msg)
+            status_label.config(text="Error: Check log")
+            messagebox.showerror("Error", error_msg)
+
+    def query_and_generate():
+        try:
+            if not catalog_folder['path']:
+                raise ValueError("Scan folder not selected")
+            bounds = {key: float(entry.get()) if entry.get().strip() else None for key, entry in query_entries.items()}
+            since = since_entry.get().strip() or None
+            if since is not None:
+                since = datetime.strptime(since, "%Y-%m-%d")
+            update_catalog(catalog_folder['path'])
+            scans = query_scans(catalog_folder['path'], since=since, **bounds)
+            if not scans:
+                raise ValueError("No catalogued scans match the query")
+            for scan in scans:
+                print(f"{scan['scan_time']}: {os.path.basename(scan['path'])} - center RA {scan['center_ra']:.2f}, "
+                      f"Dec {scan['center_dec']:.2f}, {scan['num_points']} points")
+            status_label.config(text=f"Generating image from {len(scans)} scans...")
+            root.update_idletasks()
+            data_points, grid_spacing = load_catalog_data(scans)
+            generate_image(data_points, grid_spacing)
+            status_label.config(text="Image generated successfully")
+        except Exception as e:
+            error_msg = f"Error querying scan catalog: {str(e)}"
+            print(error_msg)
+            log_error(error_msg)
+            status_label.config(text="Error: Check log")
+            messagebox.showerror("Error", error_msg)
+
+    # Raw IQ Reprocessing
+    reprocess_frame = ttk.LabelFrame(frame, text="Raw IQ Reprocessing", padding="5")
+    reprocess_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
+    raw_folder = {'path': ""}
+    raw_folder_button = ttk.Button(reprocess_frame, text="Select Raw Recording Folder", command=lambda: select_raw_folder())
+    raw_folder_button.grid(row=0, column=0, columnspan=2, pady=5)
+    raw_folder_label = ttk.Label(reprocess_frame, text="Raw Folder: Not Selected")
+    raw_folder_label.grid(row=0, column=2, columnspan=2, pady=5)
+    ttk.Label(reprocess_frame, text="Bandwidth (Hz):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
+    reprocess_bandwidth_entry = ttk.Entry(reprocess_frame, width=10)
+    reprocess_bandwidth_entry.insert(0, "10000")
+    reprocess_bandwidth_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(reprocess_frame, text="Window:").grid(row=1, column=2, sticky=tk.W, padx=5, pady=2)
+    window_combobox = ttk.Combobox(reprocess_frame, values=WINDOW_FUNCTIONS, width=10, state="readonly")
+    window_combobox.set("none")
+    window_combobox.grid(row=1, column=3, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(reprocess_frame, text="RFI Threshold (sigma, 0 = off):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
+    rfi_entry = ttk.Entry(reprocess_frame, width=10)
+    rfi_entry.insert(0, "0")
+    rfi_entry.grid(row=2, column=1, sticky=tk.W, padx=5, pady=2)
+    reprocess_button = ttk.Button(reprocess_frame, text="Reprocess and Generate Image", command=lambda: reprocess_and_generate())
+    reprocess_button.grid(row=3, column=0, columnspan=4, pady=5)
+
+    def select_raw_folder():
+        raw_folder['path'] = filedialog.askdirectory()
+        raw_folder_label.config(text=f"Raw Folder: {raw_folder['path'] if raw_folder['path'] else 'Not Selected'}")
+
+    def reprocess_and_generate():
+        try:
+            if not raw_folder['path']:
+                raise ValueError("Raw recording folder not selected")
+            bandwidth = float(reprocess_bandwidth_entry.get())
+            rfi_threshold = float(rfi_entry.get())
+            if bandwidth <= 0:
+                raise ValueError("Bandwidth must be positive")
+            if rfi_threshold < 0:
+                raise ValueError("RFI threshold cannot be negative")
+            status_label.config(text="Reprocessing raw IQ...")
+            reprocess_button.config(state="disabled")
+            root.update_idletasks()
+            file_path = reprocess_raw_recording(raw_folder['path'], bandwidth, window_combobox.get(), rfi_threshold or None)
+            data_points, grid_spacing = read_data_from_file(file_path)
+            generate_image(data_points, grid_spacing)
+            status_label.config(text="Reprocessed image generated successfully")
+        except Exception as e:
+            error_msg = f"Error reprocessing raw IQ: {str(e)}"
+            print(error_msg)
+            log_error(error_msg)
+            status_label.config(text="Error: Check log")
+            messagebox.showerror("Error", error_msg)
+        finally:
+            reprocess_button.config(state="normal")
+
+    # Field Co-adding
+    field_frame = ttk.LabelFrame(frame, text="Field Co-adding", padding="5")
+    field_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
+    field_file = {'path': ""}
+    field_button = ttk.Button(field_frame, text="Select or Create Field File", command=lambda: select_field_file())
+    field_button.grid(row=0, column=0, padx=5, pady=5)
+    field_label = ttk.Label(field_frame, text="Field File: Not Selected")
+    field_label.grid(row=0, column=1, columnspan=2, padx=5, pady=5)
+    add_scans_button = ttk.Button(field_frame, text="Add Scans to Field", command=lambda: add_scans_to_field())
+    add_scans_button.grid(row=1, column=0, padx=5, pady=5)
+    show_field_button = ttk.Button(field_frame, text="Show Co-added and Noise Maps", command=lambda: show_field())
+    show_field_button.grid(row=1, column=1, padx=5, pady=5)
+
+    # Velocity Cube
+    cube_frame = ttk.LabelFrame(frame, text="Velocity Cube", padding="5")
+    cube_frame.grid(row=5, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
+    cube_entries = {}
+    for index, (key, label, default) in enumerate([("v_min", "Min Velocity (km/s):", "-150"),
+                                                   ("v_max", "Max Velocity (km/s):", "150"),
+                                                   ("dv", "Channel Width (km/s):", "2")]):
+        ttk.Label(cube_frame, text=label).grid(row=index, column=0, sticky=tk.W, padx=5, pady=2)
+        cube_entries[key] = ttk.Entry(cube_frame, width=10)
+        cube_entries[key].insert(0, default)
+        cube_entries[key].grid(row=index, column=1, sticky=tk.W, padx=5, pady=2)
+    ttk.Label(cube_frame, text="Velocity Frame:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
+    frame_combobox = ttk.Combobox(cube_frame, values=VELOCITY_FRAMES, width=12, state="readonly")
+    frame_combobox.set("lsr")
+    frame_combobox.grid(row=3, column=1, sticky=tk.W, padx=5, pady=2)
+    cube_button = ttk.Button(cube_frame, text="Build Cube from Scans", command=lambda: build_cube())
+    cube_button.grid(row=4, column=0, columnspan=2, pady=5)
+
+    def select_field_file():
+        field_file['path'] = filedialog.asksaveasfilename(defaultextension=".npz", filetypes=[("Field files", "*.npz")],
+                                                          confirmoverwrite=False)
+        field_label.config(text=f"Field File: {field_file['path'] if field_file['path'] else 'Not Selected'}")
+
+    def add_scans_to_field():
+        try:
+            if not field_file['path']:
+                raise ValueError("Field file not selected")
+            file_paths = filedialog.askopenfilenames(filetypes=[("JSON files", "*.json")])
+            if not file_paths:
+                status_label.config(text="No file selected")
+                return
+            status_label.config(text=f"Merging {len(file_paths)} scans into field...")
+            root.update_idletasks()
+            for file_path in file_paths:
+                accumulator = merge_scan_into_field(field_file['path'], file_path)
+            status_label.config(text=f"Field now holds {len(accumulator['merged'])} scans")
+            show_field_maps(accumulator)
+        except Exception as e:
+            error_msg = f"Error adding scans to field: {str(e)}"
+            print(error_msg)
+            log_error(error_msg)
+            status_label.config(text="Error: Check log")
+            messagebox.showerror("Error", error_msg)
+
+    def build_cube():
+        try:
+            v_min, v_max, dv = (float(cube_entries[key].get()) for key in ("v_min", "v_max", "dv"))
+            if dv <= 0 or v_max <= v_min:
+                raise ValueError("Velocity range must be increasing and channel width positive")
+            file_paths = filedialog.askopenfilenames(filetypes=[("JSON files", "*.json")])
+            if not file_paths:
+                status_label.config(text="No file selected")
+                return
+            status_label.config(text=f"Building velocity cube from {len(file_paths)} scans...")
+            root.update_idletasks()
+            cube = build_velocity_cube(file_paths, v_min, v_max, dv, frame_combobox.get())
+            cube_path = os.path.splitext(file_paths[0])[0] + "_cube.npz"
+            np.savez(cube_path, **cube)
+            print(f"Velocity cube {cube['cube'].shape} saved to {cube_path}")
+            status_label.config(text="Velocity cube built successfully")
+            show_moment_maps(cube)
+        except Exception as e:
+            error_msg = f"Error building velocity cube: {str(e)}"
+            print(error_msg)
+            log_error(error_msg)
+            status_label.config(text="Error: Check log")
+            messagebox.showerror("Error", error_msg)
+
+    def show_field():
+        try:
+            if not field_file['path'] or not os.path.exists(field_file['path']):
+                raise ValueError("Field file not selected or has no scans yet")
+            show_field_maps(load_field_accumulator(field_file['path']))
+        except Exception as e:
+            error_msg = f"Error showing field maps: {str(e)}"
+            print(error_msg)
+            log_error(error_msg)
+            status_label.config(text="Error: Check log")
+            messagebox.showerror("Error", error_msg)
+
     return frame
 
 def create_slew_tool_frame(parent, root, log_text):
@@ -791,6 +3218,66 @@ def create_calculators_frame(parent, root, log_text):
             status_label.config(text="Error: Invalid input")
             messagebox.showerror("Error", error_msg)
 
+    # Survey Planner
+    planner_frame = ttk.LabelFrame(frame, text="Survey Planner", padding="5")
+    planner_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=5)
+    planner_entries = {}
+    for index, (key, label, default) in enumerate([
+            ("region_width", "Region Width (degrees):", "20"),
+            ("region_height", "Region Height (degrees):", "20"),
+            ("diameter", "Dish Diameter (meters):", "1"),
+            ("overlap", "Overlap Percentage (%):", "30"),
+            ("averaging_time", "Total Averaging Time (s):", "2"),
+            ("settle", "Settle Time (s):", "2"),
+            ("slew_rate", "Slew Rate (deg/s):", "3"),
+            ("slew_overhead", "Slew Overhead (s per slew):", "1"),
+            ("sample_rate", "Sample Rate (Hz):", "250000"),
+            ("spectrum_channels", "Spectrum Channels:", "0")]):
+        ttk.Label(planner_frame, text=label).grid(row=index, column=0, sticky=tk.W, padx=5, pady=2)
+        planner_entries[key] = ttk.Entry(planner_frame, width=15)
+        planner_entries[key].insert(0, default)
+        planner_entries[key].grid(row=index, column=1, sticky=tk.W, padx=5, pady=2)
+    planner_raw_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(planner_frame, text="Record raw IQ", variable=planner_raw_var).grid(row=10, column=0, columnspan=2, sticky=tk.W, padx=5, pady=2)
+    planner_result_label = ttk.Label(planner_frame, text="Plan: Not calculated", justify=tk.LEFT)
+    planner_result_label.grid(row=11, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+    plan_button = ttk.Button(planner_frame, text="Plan Survey", command=lambda: plan_survey_action())
+    plan_button.grid(row=12, column=0, columnspan=2, pady=10)
+
+    def plan_survey_action():
+        try:
+            values = {key: float(entry.get()) for key, entry in planner_entries.items()}
+            for key in ("region_width", "region_height", "diameter", "averaging_time", "slew_rate", "sample_rate"):
+                if values[key] <= 0:
+                    raise ValueError(f"{key.replace('_', ' ').capitalize()} must be positive")
+            if not (0 <= values['overlap'] < 100):
+                raise ValueError("Overlap percentage must be between 0 and 100")
+            if values['settle'] < 0 or values['slew_overhead'] < 0:
+                raise ValueError("Settle time and slew overhead cannot be negative")
+            if values['spectrum_channels'] < 0 or not values['spectrum_channels'].is_integer():
+                raise ValueError("Spectrum channels must be a whole number, 0 or more")
+            values['spectrum_channels'] = int(values['spectrum_channels'])
+            status_label.config(text="Planning survey (dry run of the scan)...")
+            root.update_idletasks()
+            plan = plan_survey(record_raw=planner_raw_var.get(), **values)
+            finish = datetime.fromtimestamp(time.time() + plan['duration'])
+            lines = [
+                f"Grid: {plan['grid_width']} x {plan['grid_height']} at {plan['grid_spacing']:.4f} degrees ({plan['num_points']} pointings)",
+                f"Predicted duration: {format_duration(plan['duration'])} (ends {finish.strftime('%Y-%m-%d %H:%M')} if started now)",
+                "  " + ", ".join(f"{phase} {format_duration(total)}" for phase, total in plan['timings'].items() if phase != 'total'),
+                f"Disk space: {format_size(plan['disk']['total'])} (scan file {format_size(plan['disk']['json'])}, "
+                f"catalog and cache {format_size(plan['disk']['cache'])}, raw IQ {format_size(plan['disk']['raw'])})"
+            ]
+            planner_result_label.config(text="\n".join(lines))
+            status_label.config(text="Plan calculated")
+            print("\n".join(lines))
+        except ValueError as e:
+            error_msg = f"Invalid input: {str(e)}"
+            print(error_msg)
+            log_error(error_msg)
+            status_label.config(text="Error: Invalid input")
+            messagebox.showerror("Error", error_msg)
+
     return frame
 
 def switch_mode(mode, frames, main_frame, canvas, root):
@@ -798,7 +3285,7 @@ def switch_mode(mode, frames, main_frame, canvas, root):
         frame.grid_forget()
     frames[mode].grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
     # Resize window based on mode
-    if mode == "Data Collection":
+    if mode in ("Data Collection", "Time Series"):
         root.geometry("900x600")
     else:  # Image Assembly, Slew Tool, or Calculators
         root.geometry("600x400")
@@ -806,100 +3293,102 @@ def switch_mode(mode, frames, main_frame, canvas, root):
     canvas.update_idletasks()
     canvas.configure(scrollregion=canvas.bbox("all"))
 
-# Main GUI setup
-try:
-    print("Initializing GUI...")
-    root = tk.Tk()
-    root.title("Radio Astronomy Master Controller")
-    root.geometry("900x600")  # Start with Data Collection size
-    root.resizable(False, False)
-    print("Root window created.")
-
-    # Create a canvas and scrollbar
-    canvas = tk.Canvas(root)
-    scrollbar = ttk.Scrollbar(root, orient=tk.VERTICAL, command=canvas.yview)
-    canvas.configure(yscrollcommand=scrollbar.set)
-    canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-    scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-    root.rowconfigure(0, weight=1)
-    root.columnconfigure(0, weight=1)
-    print("Canvas and scrollbar configured.")
-
-    # Add mouse wheel and touchpad scrolling support
-    def on_mouse_scroll(event):
-        # Handle mouse wheel and two-finger scrolling
-        if event.delta:
-            # Windows and macOS: event.delta is positive for up, negative for down
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        elif event.num == 4:
-            # Linux: Button-4 is scroll up
-            canvas.yview_scroll(-1, "units")
-        elif event.num == 5:
-            # Linux: Button-5 is scroll down
-            canvas.yview_scroll(1, "units")
-
-    # Bind scroll events (cross-platform)
-    canvas.bind("<MouseWheel>", on_mouse_scroll)  # Windows and macOS
-    canvas.bind("<Button-4>", on_mouse_scroll)   # Linux scroll up
-    canvas.bind("<Button-5>", on_mouse_scroll)   # Linux scroll down
-
-    # Create a frame inside the canvas
-    main_frame = ttk.Frame(canvas, padding="10")
-    canvas_frame = canvas.create_window((0, 0), window=main_frame, anchor="nw")
-    main_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-    main_frame.rowconfigure(2, weight=1)
-    main_frame.columnconfigure(0, weight=1)
-    print("Main frame created.")
-
-    # Mode Selection
-    mode_frame = ttk.LabelFrame(main_frame, text="Select Mode", padding="5")
-    mode_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=5)
-    mode_combobox = ttk.Combobox(mode_frame, values=MODES, width=30, state="readonly")
-    mode_combobox.set("Data Collection")
-    mode_combobox.grid(row=0, column=0, padx=5, pady=5)
-    print("Mode selection configured.")
-
-    # Log Output (placed at the bottom)
-    log_frame = ttk.LabelFrame(main_frame, text="Log Output", padding="5")
-    log_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-    log_frame.rowconfigure(0, weight=1)
-    log_frame.columnconfigure(0, weight=1)
-    log_text = tk.Text(log_frame, height=10, width=60, wrap=tk.WORD)
-    log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-    log_scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=log_text.yview)
-    log_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-    log_text['yscrollcommand'] = log_scrollbar.set
-    sys.stdout = StdoutRedirector(log_text, root)
-    print("Log output configured.")
-
-    # Mode Frames
-    frames = {
-        "Data Collection": create_data_collection_frame(main_frame, root, log_text),
-        "Image Assembly": create_image_assembly_frame(main_frame, root, log_text),
-        "Slew Tool": create_slew_tool_frame(main_frame, root, log_text),
-        "Calculators": create_calculators_frame(main_frame, root, log_text)
-    }
-    frames["Data Collection"].grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
-    print("Mode frames created.")
+# Main GUI setup (guarded so worker processes can import this file without opening a window)
+if __name__ == "__main__":
+    try:
+        print("Initializing GUI...")
+        root = tk.Tk()
+        root.title("Radio Astronomy Master Controller")
+        root.geometry("900x600")  # Start with Data Collection size
+        root.resizable(False, False)
+        print("Root window created.")
+
+        # Create a canvas and scrollbar
+        canvas = tk.Canvas(root)
+        scrollbar = ttk.Scrollbar(root, orient=tk.VERTICAL, command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        root.rowconfigure(0, weight=1)
+        root.columnconfigure(0, weight=1)
+        print("Canvas and scrollbar configured.")
+
+        # Add mouse wheel and touchpad scrolling support
+        def on_mouse_scroll(event):
+            # Handle mouse wheel and two-finger scrolling
+            if event.delta:
+                # Windows and macOS: event.delta is positive for up, negative for down
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            elif event.num == 4:
+                # Linux: Button-4 is scroll up
+                canvas.yview_scroll(-1, "units")
+            elif event.num == 5:
+                # Linux: Button-5 is scroll down
+                canvas.yview_scroll(1, "units")
+
+        # Bind scroll events (cross-platform)
+        canvas.bind("<MouseWheel>", on_mouse_scroll)  # Windows and macOS
+        canvas.bind("<Button-4>", on_mouse_scroll)   # Linux scroll up
+        canvas.bind("<Button-5>", on_mouse_scroll)   # Linux scroll down
+
+        # Create a frame inside the canvas
+        main_frame = ttk.Frame(canvas, padding="10")
+        canvas_frame = canvas.create_window((0, 0), window=main_frame, anchor="nw")
+        main_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        main_frame.rowconfigure(2, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+        print("Main frame created.")
+
+        # Mode Selection
+        mode_frame = ttk.LabelFrame(main_frame, text="Select Mode", padding="5")
+        mode_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=5)
+        mode_combobox = ttk.Combobox(mode_frame, values=MODES, width=30, state="readonly")
+        mode_combobox.set("Data Collection")
+        mode_combobox.grid(row=0, column=0, padx=5, pady=5)
+        print("Mode selection configured.")
+
+        # Log Output (placed at the bottom)
+        log_frame = ttk.LabelFrame(main_frame, text="Log Output", padding="5")
+        log_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        log_frame.rowconfigure(0, weight=1)
+        log_frame.columnconfigure(0, weight=1)
+        log_text = tk.Text(log_frame, height=10, width=60, wrap=tk.WORD)
+        log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+        log_scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=log_text.yview)
+        log_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        log_text['yscrollcommand'] = log_scrollbar.set
+        sys.stdout = StdoutRedirector(log_text, root)
+        print("Log output configured.")
+
+        # Mode Frames
+        frames = {
+            "Data Collection": create_data_collection_frame(main_frame, root, log_text),
+            "Time Series": create_time_series_frame(main_frame, root, log_text),
+            "Image Assembly": create_image_assembly_frame(main_frame, root, log_text),
+            "Slew Tool": create_slew_tool_frame(main_frame, root, log_text),
+            "Calculators": create_calculators_frame(main_frame, root, log_text)
+        }
+        frames["Data Collection"].grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+        print("Mode frames created.")
 
-    # Bind mode switch
-    mode_combobox.bind("<<ComboboxSelected>>", lambda event: switch_mode(mode_combobox.get(), frames, main_frame, canvas, root))
-    print("Mode switch bound.")
+        # Bind mode switch
+        mode_combobox.bind("<<ComboboxSelected>>", lambda event: switch_mode(mode_combobox.get(), frames, main_frame, canvas, root))
+        print("Mode switch bound.")
 
-    # Update canvas scroll region after initial layout
-    root.after(100, lambda: canvas.configure(scrollregion=canvas.bbox("all")))
-    print("Canvas scroll region scheduled.")
+        # Update canvas scroll region after initial layout
+        root.after(100, lambda: canvas.configure(scrollregion=canvas.bbox("all")))
+        print("Canvas scroll region scheduled.")
 
-    root.mainloop()
-    print("GUI event loop started.")
+        root.mainloop()
+        print("GUI event loop started.")
 
-except Exception as e:
-    error_msg = f"Failed to initialize GUI: {str(e)}\n{traceback.format_exc()}"
-    print(error_msg)
-    log_error(error_msg)
-    try:
-        tk.Tk().withdraw()
-        messagebox.showerror("Initialization Error", f"Failed to start GUI: {str(e)}")
-    except:
-        print("Failed to show error messagebox.")
-    sys.exit(1)
\ No newline at end of file
+    except Exception as e:
+        error_msg = f"Failed to initialize GUI: {str(e)}\n{traceback.format_exc()}"
+        print(error_msg)
+        log_error(error_msg)
+        try:
+            tk.Tk().withdraw()
+            messagebox.showerror("Initialization Error", f"Failed to start GUI: {str(e)}")
+        except:
+            print("Failed to show error messagebox.")
+        sys.exit(1)
\ No newline at end of file
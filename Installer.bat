@@ -125,7 +125,7 @@ python -m pip install --upgrade pip wheel || (
 REM Install necessary Python packages
 echo Installing Python packages... >> "%LOGFILE%"
 echo Installing Python packages...
-pip install numpy matplotlib pillow tk pyrtlsdr pywin32 || (
+pip install numpy scipy matplotlib pillow tk pyrtlsdr pywin32 || (
     echo Failed to install Python packages. >> "%LOGFILE%"
     echo Failed to install Python packages.
     pause